@@ -584,6 +584,8 @@ class SamplingOrchestrator:
         import duckdb
         import polars as pl
 
+        from kontra.engine.backends.duckdb_session import ensure_extension
+
         path = handle.uri
         fs_opts = handle.fs_opts or {}
 
@@ -592,7 +594,7 @@ class SamplingOrchestrator:
         try:
             # Configure S3 credentials from fs_opts (keys are s3_* prefixed per handle.py)
             if handle.scheme == "s3":
-                con.execute("INSTALL httpfs; LOAD httpfs;")
+                ensure_extension(con, "httpfs")
                 if fs_opts.get("s3_access_key_id"):
                     con.execute(f"SET s3_access_key_id='{fs_opts['s3_access_key_id']}';")
                 if fs_opts.get("s3_secret_access_key"):
@@ -677,11 +679,13 @@ class SamplingOrchestrator:
         import duckdb
         import os
 
+        from kontra.engine.backends.duckdb_session import ensure_extension
+
         con = duckdb.connect()
 
         # Configure S3 if needed
         if path.startswith("s3://"):
-            con.execute("INSTALL httpfs; LOAD httpfs;")
+            ensure_extension(con, "httpfs")
             if os.environ.get("AWS_ACCESS_KEY_ID"):
                 con.execute(f"SET s3_access_key_id='{os.environ['AWS_ACCESS_KEY_ID']}';")
             if os.environ.get("AWS_SECRET_ACCESS_KEY"):
@@ -735,6 +739,8 @@ class SamplingOrchestrator:
         import duckdb
         import os
 
+        from kontra.engine.backends.duckdb_session import ensure_extension
+
         if not rules_to_sample:
             return {}
 
@@ -742,7 +748,7 @@ class SamplingOrchestrator:
 
         # Configure S3 if needed
         if path.startswith("s3://"):
-            con.execute("INSTALL httpfs; LOAD httpfs;")
+            ensure_extension(con, "httpfs")
             if os.environ.get("AWS_ACCESS_KEY_ID"):
                 con.execute(f"SET s3_access_key_id='{os.environ['AWS_ACCESS_KEY_ID']}';")
             if os.environ.get("AWS_SECRET_ACCESS_KEY"):
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Literal, Optional
 
 import typer
 
 from kontra.cli.constants import EXIT_CONFIG_ERROR, EXIT_SUCCESS
+from kontra.errors import format_error_for_cli
 
 
 def register(app: typer.Typer) -> None:
@@ -129,8 +131,6 @@ def register(app: typer.Typer) -> None:
         try:
             effective = resolve_effective_config(env_name=env)
         except Exception as e:
-            from kontra.errors import format_error_for_cli
-
             typer.secho(f"Error: {format_error_for_cli(e)}", fg=typer.colors.RED)
             raise typer.Exit(code=EXIT_CONFIG_ERROR)
 
@@ -145,13 +145,18 @@ def register(app: typer.Typer) -> None:
 
         config_dict = effective.to_dict()
 
+        # Serialize straight into stdout rather than building the document first.
         if output_format == "json":
             import json
 
-            typer.echo(json.dumps(config_dict, indent=2))
+            json.dump(config_dict, sys.stdout, indent=2)
+            sys.stdout.write("\n")
         else:
             import yaml
 
-            typer.echo(yaml.dump(config_dict, default_flow_style=False, sort_keys=False))
+            yaml.safe_dump(
+                config_dict, sys.stdout, default_flow_style=False, sort_keys=False
+            )
+        sys.stdout.flush()
 
         raise typer.Exit(code=EXIT_SUCCESS)
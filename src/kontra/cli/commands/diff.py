@@ -8,18 +8,19 @@ import typer
 
 from kontra.cli.constants import (
     EXIT_CONFIG_ERROR,
-    EXIT_RUNTIME_ERROR,
     EXIT_SUCCESS,
     EXIT_VALIDATION_FAILED,
 )
-from kontra.cli.renderers import render_diff_rich, render_profile_diff_rich
-from kontra.cli.utils import parse_duration
+from kontra.cli.renderers import iter_diff_lines, render_profile_diff_rich
+from kontra.cli.utils import cli_error_handler, parse_duration, write_lines
+from kontra.errors import format_error_for_cli
 
 
 def register(app: typer.Typer) -> None:
     """Register the diff and profile-diff commands with the app."""
 
     @app.command("diff")
+    @cli_error_handler
     def diff_cmd(
         contract: Optional[str] = typer.Argument(
             None, help="Contract path or fingerprint. If not provided, uses most recent."
@@ -74,206 +75,173 @@ def register(app: typer.Typer) -> None:
         """
         from datetime import datetime, timedelta, timezone
 
-        try:
-            from kontra.config.settings import resolve_effective_config
-            from kontra.config.loader import ContractLoader
-            from kontra.errors import ConfigError, ContractError
-            from kontra.state.backends import get_default_store, get_store
-            from kontra.state.fingerprint import fingerprint_contract
-            from kontra.state.types import StateDiff
+        from kontra.config.settings import resolve_effective_config
+        from kontra.config.loader import ContractLoader
+        from kontra.state.backends import get_default_store, get_store
+        from kontra.state.fingerprint import fingerprint_contract
+        from kontra.state.types import StateDiff
 
-            # --- LOAD CONFIG ---
-            cli_overrides = {"state_backend": state_backend}
+        # --- LOAD CONFIG ---
+        cli_overrides = {"state_backend": state_backend}
 
-            try:
-                config = resolve_effective_config(
-                    env_name=env, cli_overrides=cli_overrides
-                )
-            except Exception as e:
-                from kontra.errors import format_error_for_cli
+        try:
+            config = resolve_effective_config(
+                env_name=env, cli_overrides=cli_overrides
+            )
+        except Exception as e:
+            typer.secho(
+                f"Config error: {format_error_for_cli(e)}", fg=typer.colors.RED
+            )
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
 
+        effective_state_backend = config.state_backend
+
+        # Get store
+        if effective_state_backend and effective_state_backend != "local":
+            store = get_store(effective_state_backend)
+        else:
+            store = get_default_store()
+
+        # Determine contract fingerprint
+        contract_fp = None
+        if contract:
+            # Could be a path or a fingerprint
+            if len(contract) == 16 and all(
+                c in "0123456789abcdef" for c in contract
+            ):
+                # Looks like a fingerprint
+                contract_fp = contract
+            else:
+                # Treat as path, load and compute semantic fingerprint
+                contract_obj = ContractLoader.from_path(contract)
+                contract_fp = fingerprint_contract(contract_obj)
+
+        # If no contract specified, find most recent
+        if not contract_fp:
+            contracts = store.list_contracts()
+            if not contracts:
                 typer.secho(
-                    f"Config error: {format_error_for_cli(e)}", fg=typer.colors.RED
+                    "No validation state found. Run 'kontra validate' first.",
+                    fg=typer.colors.YELLOW,
                 )
-                raise typer.Exit(code=EXIT_CONFIG_ERROR)
-
-            effective_state_backend = config.state_backend
+                raise typer.Exit(code=EXIT_SUCCESS)
 
-            # Get store
-            if effective_state_backend and effective_state_backend != "local":
-                store = get_store(effective_state_backend)
-            else:
-                store = get_default_store()
-
-            # Determine contract fingerprint
-            contract_fp = None
-            if contract:
-                # Could be a path or a fingerprint
-                if len(contract) == 16 and all(
-                    c in "0123456789abcdef" for c in contract
+            # Get most recent across all contracts
+            most_recent = None
+            most_recent_fp = None
+            for fp in contracts:
+                latest = store.get_latest(fp)
+                if latest and (
+                    most_recent is None or latest.run_at > most_recent.run_at
                 ):
-                    # Looks like a fingerprint
-                    contract_fp = contract
-                else:
-                    # Treat as path, load and compute semantic fingerprint
-                    contract_obj = ContractLoader.from_path(contract)
-                    contract_fp = fingerprint_contract(contract_obj)
-
-            # If no contract specified, find most recent
-            if not contract_fp:
-                contracts = store.list_contracts()
-                if not contracts:
-                    typer.secho(
-                        "No validation state found. Run 'kontra validate' first.",
-                        fg=typer.colors.YELLOW,
-                    )
-                    raise typer.Exit(code=EXIT_SUCCESS)
+                    most_recent = latest
+                    most_recent_fp = fp
 
-                # Get most recent across all contracts
-                most_recent = None
-                most_recent_fp = None
-                for fp in contracts:
-                    latest = store.get_latest(fp)
-                    if latest and (
-                        most_recent is None or latest.run_at > most_recent.run_at
-                    ):
-                        most_recent = latest
-                        most_recent_fp = fp
-
-                if not most_recent_fp:
-                    typer.secho("No validation state found.", fg=typer.colors.YELLOW)
-                    raise typer.Exit(code=EXIT_SUCCESS)
+            if not most_recent_fp:
+                typer.secho("No validation state found.", fg=typer.colors.YELLOW)
+                raise typer.Exit(code=EXIT_SUCCESS)
 
-                contract_fp = most_recent_fp
+            contract_fp = most_recent_fp
 
-            history = store.get_history(contract_fp, limit=100)
+        history = store.get_history(contract_fp, limit=100)
 
-            if len(history) < 1:
-                typer.secho(
-                    f"No state history found for contract {contract_fp}.",
-                    fg=typer.colors.YELLOW,
-                )
-                raise typer.Exit(code=EXIT_SUCCESS)
+        if len(history) < 1:
+            typer.secho(
+                f"No state history found for contract {contract_fp}.",
+                fg=typer.colors.YELLOW,
+            )
+            raise typer.Exit(code=EXIT_SUCCESS)
 
-            # Determine which states to compare
-            after_state = history[0]  # Most recent
-            before_state = None
-
-            if since:
-                # Parse duration and find state from that time ago
-                try:
-                    seconds = parse_duration(since)
-                    target_time = datetime.now(timezone.utc) - timedelta(seconds=seconds)
-
-                    for state in history[1:]:
-                        if state.run_at <= target_time:
-                            before_state = state
-                            break
-
-                    if not before_state:
-                        typer.secho(
-                            f"No state found from {since} ago.", fg=typer.colors.YELLOW
-                        )
-                        raise typer.Exit(code=EXIT_SUCCESS)
-
-                except ValueError as e:
-                    typer.secho(f"Error: {e}", fg=typer.colors.RED)
-                    raise typer.Exit(code=EXIT_CONFIG_ERROR)
-
-            elif run:
-                # Parse specific date/time
-                try:
-                    if "T" in run:
-                        target_time = datetime.fromisoformat(
-                            run.replace("Z", "+00:00")
-                        )
-                    else:
-                        target_time = datetime.strptime(run, "%Y-%m-%d").replace(
-                            tzinfo=timezone.utc
-                        )
-
-                    # Find state closest to this time
-                    for state in history:
-                        if state.run_at.date() <= target_time.date():
-                            before_state = state
-                            break
-
-                    if not before_state:
-                        typer.secho(
-                            f"No state found for date {run}.", fg=typer.colors.YELLOW
-                        )
-                        raise typer.Exit(code=EXIT_SUCCESS)
-
-                except ValueError:
-                    typer.secho(
-                        f"Invalid date format: {run}. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM.",
-                        fg=typer.colors.RED,
-                    )
-                    raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        # Determine which states to compare
+        after_state = history[0]  # Most recent
+        before_state = None
 
-            else:
-                # Default: compare to previous run
-                if len(history) < 2:
+        if since:
+            # Parse duration and find state from that time ago
+            try:
+                seconds = parse_duration(since)
+                target_time = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
+                for state in history[1:]:
+                    if state.run_at <= target_time:
+                        before_state = state
+                        break
+
+                if not before_state:
                     typer.secho(
-                        "Only one state found. Need at least two runs to diff.",
-                        fg=typer.colors.YELLOW,
-                    )
-                    typer.echo(
-                        f"\nLatest state: {after_state.run_at.strftime('%Y-%m-%d %H:%M')}"
-                    )
-                    typer.echo(
-                        f"Result: {'PASSED' if after_state.summary.passed else 'FAILED'}"
+                        f"No state found from {since} ago.", fg=typer.colors.YELLOW
                     )
                     raise typer.Exit(code=EXIT_SUCCESS)
 
-                before_state = history[1]
-
-            diff = StateDiff.compute(before_state, after_state)
+            except ValueError as e:
+                typer.secho(f"Error: {e}", fg=typer.colors.RED)
+                raise typer.Exit(code=EXIT_CONFIG_ERROR)
 
-            # Render output
-            if output_format == "json":
-                typer.echo(diff.to_json())
-            elif output_format == "llm":
-                typer.echo(diff.to_llm())
-            else:
-                typer.echo(render_diff_rich(diff))
+        elif run:
+            # Parse specific date/time
+            try:
+                if "T" in run:
+                    target_time = datetime.fromisoformat(
+                        run.replace("Z", "+00:00")
+                    )
+                else:
+                    target_time = datetime.strptime(run, "%Y-%m-%d").replace(
+                        tzinfo=timezone.utc
+                    )
 
-            # Exit code based on regressions
-            if diff.has_regressions:
-                raise typer.Exit(code=EXIT_VALIDATION_FAILED)
-            raise typer.Exit(code=EXIT_SUCCESS)
+                # Find state closest to this time
+                for state in history:
+                    if state.run_at.date() <= target_time.date():
+                        before_state = state
+                        break
 
-        except typer.Exit:
-            raise
+                if not before_state:
+                    typer.secho(
+                        f"No state found for date {run}.", fg=typer.colors.YELLOW
+                    )
+                    raise typer.Exit(code=EXIT_SUCCESS)
 
-        except FileNotFoundError as e:
-            typer.secho(f"Error: {e}", fg=typer.colors.RED)
-            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+            except ValueError:
+                typer.secho(
+                    f"Invalid date format: {run}. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM.",
+                    fg=typer.colors.RED,
+                )
+                raise typer.Exit(code=EXIT_CONFIG_ERROR)
 
-        except (ContractError, ConfigError) as e:
-            # Missing/invalid contract or config is a config error (exit 2),
-            # matching `kontra validate`. ContractNotFoundError is a KontraError,
-            # not a FileNotFoundError, so it must be caught explicitly.
-            from kontra.errors import format_error_for_cli
+        else:
+            # Default: compare to previous run
+            if len(history) < 2:
+                typer.secho(
+                    "Only one state found. Need at least two runs to diff.",
+                    fg=typer.colors.YELLOW,
+                )
+                typer.echo(
+                    f"\nLatest state: {after_state.run_at.strftime('%Y-%m-%d %H:%M')}"
+                )
+                typer.echo(
+                    f"Result: {'PASSED' if after_state.summary.passed else 'FAILED'}"
+                )
+                raise typer.Exit(code=EXIT_SUCCESS)
 
-            typer.secho(f"Error: {format_error_for_cli(e)}", fg=typer.colors.RED)
-            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+            before_state = history[1]
 
-        except Exception as e:
-            from kontra.errors import format_error_for_cli
+        diff = StateDiff.compute(before_state, after_state)
 
-            msg = format_error_for_cli(e)
-            if verbose:
-                import traceback
+        # Render output
+        if output_format == "json":
+            typer.echo(diff.to_json())
+        elif output_format == "llm":
+            typer.echo(diff.to_llm())
+        else:
+            write_lines(iter_diff_lines(diff))
 
-                typer.secho(
-                    f"Error: {msg}\n\n{traceback.format_exc()}", fg=typer.colors.RED
-                )
-            else:
-                typer.secho(f"Error: {msg}", fg=typer.colors.RED)
-            raise typer.Exit(code=EXIT_RUNTIME_ERROR)
+        # Exit code based on regressions
+        if diff.has_regressions:
+            raise typer.Exit(code=EXIT_VALIDATION_FAILED)
+        raise typer.Exit(code=EXIT_SUCCESS)
 
     @app.command("profile-diff")
+    @cli_error_handler
     def profile_diff_cmd(
         source: Optional[str] = typer.Argument(
             None, help="Source URI or fingerprint. If not provided, uses most recent."
@@ -308,136 +276,114 @@ def register(app: typer.Typer) -> None:
             kontra profile-diff --since 7d         # Compare to 7 days ago
             kontra profile-diff -o llm             # Token-optimized output
         """
-        try:
-            from kontra.scout.store import fingerprint_source, get_default_profile_store
-            from kontra.scout.types import ProfileDiff
-
-            store = get_default_profile_store()
-
-            # Determine source fingerprint
-            source_fp = None
-            if source:
-                # Could be a URI or a fingerprint
-                if len(source) == 16 and all(
-                    c in "0123456789abcdef" for c in source
-                ):
-                    source_fp = source
-                else:
-                    source_fp = fingerprint_source(source)
-
-            # If no source specified, find most recent
-            if not source_fp:
-                sources = store.list_sources()
-                if not sources:
-                    typer.secho(
-                        "No saved profiles found. Run 'kontra profile <source> --save-profile' first.",
-                        fg=typer.colors.YELLOW,
-                    )
-                    raise typer.Exit(code=EXIT_SUCCESS)
-
-                # Get most recent across all sources
-                most_recent = None
-                most_recent_fp = None
-                for fp in sources:
-                    latest = store.get_latest(fp)
-                    if latest and (
-                        most_recent is None
-                        or latest.profiled_at > most_recent.profiled_at
-                    ):
-                        most_recent = latest
-                        most_recent_fp = fp
-
-                if not most_recent_fp:
-                    typer.secho("No saved profiles found.", fg=typer.colors.YELLOW)
-                    raise typer.Exit(code=EXIT_SUCCESS)
-
-                source_fp = most_recent_fp
-
-            history = store.get_history(source_fp, limit=100)
+        from kontra.scout.store import fingerprint_source, get_default_profile_store
+        from kontra.scout.types import ProfileDiff
+
+        store = get_default_profile_store()
+
+        # Determine source fingerprint
+        source_fp = None
+        if source:
+            # Could be a URI or a fingerprint
+            if len(source) == 16 and all(
+                c in "0123456789abcdef" for c in source
+            ):
+                source_fp = source
+            else:
+                source_fp = fingerprint_source(source)
 
-            if len(history) < 1:
+        # If no source specified, find most recent
+        if not source_fp:
+            sources = store.list_sources()
+            if not sources:
                 typer.secho(
-                    f"No profile history found for source {source_fp}.",
+                    "No saved profiles found. Run 'kontra profile <source> --save-profile' first.",
                     fg=typer.colors.YELLOW,
                 )
                 raise typer.Exit(code=EXIT_SUCCESS)
 
-            # Determine which profiles to compare
-            after_state = history[0]
-            before_state = None
-
-            if since:
-                from datetime import datetime, timedelta, timezone
-
-                try:
-                    seconds = parse_duration(since)
-                    target_dt = datetime.now(timezone.utc) - timedelta(seconds=seconds)
-                    target_str = target_dt.isoformat()
-
-                    for state in history[1:]:
-                        if state.profiled_at <= target_str:
-                            before_state = state
-                            break
-
-                    if not before_state:
-                        typer.secho(
-                            f"No profile found from {since} ago.",
-                            fg=typer.colors.YELLOW,
-                        )
-                        raise typer.Exit(code=EXIT_SUCCESS)
-
-                except ValueError as e:
-                    typer.secho(f"Error: {e}", fg=typer.colors.RED)
-                    raise typer.Exit(code=EXIT_CONFIG_ERROR)
-            else:
-                # Default: compare to previous profile
-                if len(history) < 2:
-                    typer.secho(
-                        "Only one profile found. Need at least two to diff.",
-                        fg=typer.colors.YELLOW,
-                    )
-                    typer.echo(f"\nLatest profile: {after_state.profiled_at[:16]}")
-                    typer.echo(f"Source: {after_state.source_uri}")
-                    typer.echo(
-                        f"Rows: {after_state.profile.row_count:,}, "
-                        f"Columns: {after_state.profile.column_count}"
-                    )
-                    raise typer.Exit(code=EXIT_SUCCESS)
+            # Get most recent across all sources
+            most_recent = None
+            most_recent_fp = None
+            for fp in sources:
+                latest = store.get_latest(fp)
+                if latest and (
+                    most_recent is None
+                    or latest.profiled_at > most_recent.profiled_at
+                ):
+                    most_recent = latest
+                    most_recent_fp = fp
 
-                before_state = history[1]
+            if not most_recent_fp:
+                typer.secho("No saved profiles found.", fg=typer.colors.YELLOW)
+                raise typer.Exit(code=EXIT_SUCCESS)
 
-            diff = ProfileDiff.compute(before_state, after_state)
+            source_fp = most_recent_fp
 
-            # Render output
-            if output_format == "json":
-                typer.echo(diff.to_json())
-            elif output_format == "llm":
-                typer.echo(diff.to_llm())
-            else:
-                typer.echo(render_profile_diff_rich(diff))
+        history = store.get_history(source_fp, limit=100)
 
+        if len(history) < 1:
+            typer.secho(
+                f"No profile history found for source {source_fp}.",
+                fg=typer.colors.YELLOW,
+            )
             raise typer.Exit(code=EXIT_SUCCESS)
 
-        except typer.Exit:
-            raise
+        # Determine which profiles to compare
+        after_state = history[0]
+        before_state = None
 
-        except FileNotFoundError as e:
-            typer.secho(f"Error: {e}", fg=typer.colors.RED)
-            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        if since:
+            from datetime import datetime, timedelta, timezone
 
-        except Exception as e:
-            from kontra.errors import format_error_for_cli
+            try:
+                seconds = parse_duration(since)
+                target_dt = datetime.now(timezone.utc) - timedelta(seconds=seconds)
+                target_str = target_dt.isoformat()
 
-            msg = format_error_for_cli(e)
-            if verbose:
-                import traceback
+                for state in history[1:]:
+                    if state.profiled_at <= target_str:
+                        before_state = state
+                        break
 
+                if not before_state:
+                    typer.secho(
+                        f"No profile found from {since} ago.",
+                        fg=typer.colors.YELLOW,
+                    )
+                    raise typer.Exit(code=EXIT_SUCCESS)
+
+            except ValueError as e:
+                typer.secho(f"Error: {e}", fg=typer.colors.RED)
+                raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        else:
+            # Default: compare to previous profile
+            if len(history) < 2:
                 typer.secho(
-                    f"Error: {msg}\n\n{traceback.format_exc()}", fg=typer.colors.RED
+                    "Only one profile found. Need at least two to diff.",
+                    fg=typer.colors.YELLOW,
                 )
-            else:
-                typer.secho(f"Error: {msg}", fg=typer.colors.RED)
-            raise typer.Exit(code=EXIT_RUNTIME_ERROR)
+                typer.echo(f"\nLatest profile: {after_state.profiled_at[:16]}")
+                typer.echo(f"Source: {after_state.source_uri}")
+                typer.echo(
+                    f"Rows: {after_state.profile.row_count:,}, "
+                    f"Columns: {after_state.profile.column_count}"
+                )
+                raise typer.Exit(code=EXIT_SUCCESS)
+
+            before_state = history[1]
+
+        diff = ProfileDiff.compute(before_state, after_state)
+
+        # Render output
+        if output_format == "json":
+            typer.echo(diff.to_json())
+        elif output_format == "llm":
+            typer.echo(diff.to_llm())
+        else:
+            typer.echo(render_profile_diff_rich(diff))
+
+        raise typer.Exit(code=EXIT_SUCCESS)
 
     # Deprecated alias for scout-diff
     @app.command("scout-diff", hidden=True)
@@ -456,4 +402,6 @@ def register(app: typer.Typer) -> None:
             err=True,
         )
         # Call profile-diff with same args
-        profile_diff_cmd(source, output_format, since, verbose)
\ No newline at end of file
+        profile_diff_cmd(
+            source=source, output_format=output_format, since=since, verbose=verbose
+        )
\ No newline at end of file
@@ -31,25 +31,10 @@ def handle_dry_run(contract_path: str, data_path: Optional[str], verbose: bool)
     from kontra.rule_defs.factory import RuleFactory
     from kontra.rule_defs.registry import get_all_rule_names
 
-    # Import built-in rules to populate registry
-    import kontra.rule_defs.builtin.allowed_values  # noqa: F401
-    import kontra.rule_defs.builtin.disallowed_values  # noqa: F401
-    import kontra.rule_defs.builtin.compare  # noqa: F401
-    import kontra.rule_defs.builtin.conditional_not_null  # noqa: F401
-    import kontra.rule_defs.builtin.conditional_range  # noqa: F401
-    import kontra.rule_defs.builtin.contains  # noqa: F401
-    import kontra.rule_defs.builtin.custom_sql_check  # noqa: F401
-    import kontra.rule_defs.builtin.dtype  # noqa: F401
-    import kontra.rule_defs.builtin.ends_with  # noqa: F401
-    import kontra.rule_defs.builtin.freshness  # noqa: F401
-    import kontra.rule_defs.builtin.length  # noqa: F401
-    import kontra.rule_defs.builtin.max_rows  # noqa: F401
-    import kontra.rule_defs.builtin.min_rows  # noqa: F401
-    import kontra.rule_defs.builtin.not_null  # noqa: F401
-    import kontra.rule_defs.builtin.range  # noqa: F401
-    import kontra.rule_defs.builtin.regex  # noqa: F401
-    import kontra.rule_defs.builtin.starts_with  # noqa: F401
-    import kontra.rule_defs.builtin.unique  # noqa: F401
+    from kontra.engine.phases.compilation import _ensure_builtin_rules_registered
+
+    # Populate the rule registry (no-op once registered in this process)
+    _ensure_builtin_rules_registered()
 
     checks_passed = 0
     checks_failed = 0
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Sequence
+
 import typer
 
 
@@ -109,29 +112,27 @@ def print_rich_stats(stats: dict | None) -> None:
             typer.echo(f"  - {col}: " + ", ".join(parts))
 
 
-def render_diff_rich(diff) -> str:
-    """Render validation diff in human-readable format."""
-    lines = []
-
+def iter_diff_lines(diff) -> Iterator[str]:
+    """Yield the lines of a validation diff in human-readable format."""
     # Header
     before_ts = diff.before.run_at.strftime("%Y-%m-%d %H:%M")
     after_ts = diff.after.run_at.strftime("%Y-%m-%d %H:%M")
 
-    lines.append(f"Diff: {diff.after.contract_name}")
-    lines.append(f"Comparing: {before_ts} → {after_ts}")
-    lines.append("=" * 50)
+    yield f"Diff: {diff.after.contract_name}"
+    yield f"Comparing: {before_ts} → {after_ts}"
+    yield "=" * 50
 
     # Overall status
     if diff.status_changed:
         before_status = "PASSED" if diff.before.summary.passed else "FAILED"
         after_status = "PASSED" if diff.after.summary.passed else "FAILED"
-        lines.append(f"\nOverall: {before_status} → {after_status}")
+        yield f"\nOverall: {before_status} → {after_status}"
     else:
         status = "PASSED" if diff.after.summary.passed else "FAILED"
-        lines.append(f"\nOverall: {status} (unchanged)")
+        yield f"\nOverall: {status} (unchanged)"
 
     # Summary
-    lines.append(
+    yield (
         f"\nRules: {diff.before.summary.passed_rules}/{diff.before.summary.total_rules} → "
         f"{diff.after.summary.passed_rules}/{diff.after.summary.total_rules}"
     )
@@ -139,78 +140,78 @@ def render_diff_rich(diff) -> str:
     # New failures - group by severity
     if diff.new_failures:
         # Separate by severity
-        blocking = [rd for rd in diff.new_failures if rd.severity == "blocking"]
-        warnings = [rd for rd in diff.new_failures if rd.severity == "warning"]
-        infos = [rd for rd in diff.new_failures if rd.severity == "info"]
+        blocking = diff.new_failures_by_severity.get("blocking", [])
+        warnings = diff.new_failures_by_severity.get("warning", [])
+        infos = diff.new_failures_by_severity.get("info", [])
 
         if blocking:
-            lines.append(f"\n❌ New Blocking Failures ({len(blocking)})")
+            yield f"\n❌ New Blocking Failures ({len(blocking)})"
             for rd in blocking:
                 count_info = (
                     f" ({rd.after_count:,} violations)" if rd.after_count > 0 else ""
                 )
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(f"  - {rd.rule_id}{count_info}{mode_info}")
+                yield f"  - {rd.rule_id}{count_info}{mode_info}"
 
         if warnings:
-            lines.append(f"\n⚠️  New Warnings ({len(warnings)})")
+            yield f"\n⚠️  New Warnings ({len(warnings)})"
             for rd in warnings:
                 count_info = (
                     f" ({rd.after_count:,} violations)" if rd.after_count > 0 else ""
                 )
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(f"  - {rd.rule_id}{count_info}{mode_info}")
+                yield f"  - {rd.rule_id}{count_info}{mode_info}"
 
         if infos:
-            lines.append(f"\nℹ️  New Info Issues ({len(infos)})")
+            yield f"\nℹ️  New Info Issues ({len(infos)})"
             for rd in infos:
                 count_info = (
                     f" ({rd.after_count:,} violations)" if rd.after_count > 0 else ""
                 )
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(f"  - {rd.rule_id}{count_info}{mode_info}")
+                yield f"  - {rd.rule_id}{count_info}{mode_info}"
 
     # Regressions - group by severity
     if diff.regressions:
-        blocking_reg = [rd for rd in diff.regressions if rd.severity == "blocking"]
-        warning_reg = [rd for rd in diff.regressions if rd.severity == "warning"]
-        info_reg = [rd for rd in diff.regressions if rd.severity == "info"]
+        blocking_reg = diff.regressions_by_severity.get("blocking", [])
+        warning_reg = diff.regressions_by_severity.get("warning", [])
+        info_reg = diff.regressions_by_severity.get("info", [])
 
         if blocking_reg:
-            lines.append(f"\n❌ Blocking Regressions ({len(blocking_reg)})")
+            yield f"\n❌ Blocking Regressions ({len(blocking_reg)})"
             for rd in blocking_reg:
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(
+                yield (
                     f"  - {rd.rule_id}: {rd.before_count:,} → {rd.after_count:,} (+{rd.delta:,}){mode_info}"
                 )
 
         if warning_reg:
-            lines.append(f"\n⚠️  Warning Regressions ({len(warning_reg)})")
+            yield f"\n⚠️  Warning Regressions ({len(warning_reg)})"
             for rd in warning_reg:
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(
+                yield (
                     f"  - {rd.rule_id}: {rd.before_count:,} → {rd.after_count:,} (+{rd.delta:,}){mode_info}"
                 )
 
         if info_reg:
-            lines.append(f"\nℹ️  Info Regressions ({len(info_reg)})")
+            yield f"\nℹ️  Info Regressions ({len(info_reg)})"
             for rd in info_reg:
                 mode_info = f" [{rd.failure_mode}]" if rd.failure_mode else ""
-                lines.append(
+                yield (
                     f"  - {rd.rule_id}: {rd.before_count:,} → {rd.after_count:,} (+{rd.delta:,}){mode_info}"
                 )
 
     # Resolved
     if diff.resolved:
-        lines.append(f"\n✅ Resolved ({len(diff.resolved)})")
+        yield f"\n✅ Resolved ({len(diff.resolved)})"
         for rd in diff.resolved:
-            lines.append(f"  - {rd.rule_id}")
+            yield f"  - {rd.rule_id}"
 
     # Improvements
     if diff.improvements:
-        lines.append(f"\n📈 Improvements ({len(diff.improvements)})")
+        yield f"\n📈 Improvements ({len(diff.improvements)})"
         for rd in diff.improvements:
-            lines.append(
+            yield (
                 f"  - {rd.rule_id}: {rd.before_count:,} → {rd.after_count:,} ({rd.delta:,})"
             )
 
@@ -221,9 +222,29 @@ def render_diff_rich(diff) -> str:
         and not diff.resolved
         and not diff.improvements
     ):
-        lines.append("\n✓ No changes detected")
+        yield "\n✓ No changes detected"
+
+
+def _head(
+    lines: List[str], items: Sequence[Any], n: int, fmt: Callable[[Any], str]
+) -> None:
+    """Append the first n formatted items, then an "... and N more" line."""
+    total = len(items)
+    lines.extend(fmt(item) for item in islice(items, n))
+    if total > n:
+        lines.append(f"  ... and {total - n} more")
 
-    return "\n".join(lines)
+
+def _fmt_null_rate_change(cd) -> str:
+    return f"  - {cd.column_name}: {cd.null_rate_before:.1%} → {cd.null_rate_after:.1%}"
+
+
+def _fmt_cardinality_change(cd) -> str:
+    sign = "+" if cd.distinct_count_delta > 0 else ""
+    return (
+        f"  - {cd.column_name}: {cd.distinct_count_before:,} → "
+        f"{cd.distinct_count_after:,} ({sign}{cd.distinct_count_delta:,})"
+    )
 
 
 def render_profile_diff_rich(diff) -> str:
@@ -258,47 +279,36 @@ def render_profile_diff_rich(diff) -> str:
     # Schema changes
     if diff.columns_added:
         lines.append(f"\n➕ Columns Added ({len(diff.columns_added)})")
-        for col in diff.columns_added[:10]:
-            lines.append(f"  - {col}")
-        if len(diff.columns_added) > 10:
-            lines.append(f"  ... and {len(diff.columns_added) - 10} more")
+        _head(lines, diff.columns_added, 10, lambda col: f"  - {col}")
 
     if diff.columns_removed:
         lines.append(f"\n➖ Columns Removed ({len(diff.columns_removed)})")
-        for col in diff.columns_removed[:10]:
-            lines.append(f"  - {col}")
+        _head(lines, diff.columns_removed, 10, lambda col: f"  - {col}")
 
     # Type changes
     if diff.dtype_changes:
         lines.append(f"\n🔄 Type Changes ({len(diff.dtype_changes)})")
-        for cd in diff.dtype_changes[:10]:
-            lines.append(f"  - {cd.column_name}: {cd.dtype_before} → {cd.dtype_after}")
+        _head(
+            lines,
+            diff.dtype_changes,
+            10,
+            lambda cd: f"  - {cd.column_name}: {cd.dtype_before} → {cd.dtype_after}",
+        )
 
     # Null rate increases (potential data quality issues)
     if diff.null_rate_increases:
         lines.append(f"\n⚠️  Null Rate Increases ({len(diff.null_rate_increases)})")
-        for cd in diff.null_rate_increases[:10]:
-            lines.append(
-                f"  - {cd.column_name}: {cd.null_rate_before:.1%} → {cd.null_rate_after:.1%}"
-            )
+        _head(lines, diff.null_rate_increases, 10, _fmt_null_rate_change)
 
     # Null rate decreases (improvements)
     if diff.null_rate_decreases:
         lines.append(f"\n✅ Null Rate Decreases ({len(diff.null_rate_decreases)})")
-        for cd in diff.null_rate_decreases[:10]:
-            lines.append(
-                f"  - {cd.column_name}: {cd.null_rate_before:.1%} → {cd.null_rate_after:.1%}"
-            )
+        _head(lines, diff.null_rate_decreases, 10, _fmt_null_rate_change)
 
     # Cardinality changes
     if diff.cardinality_changes:
         lines.append(f"\n📊 Cardinality Changes ({len(diff.cardinality_changes)})")
-        for cd in diff.cardinality_changes[:10]:
-            sign = "+" if cd.distinct_count_delta > 0 else ""
-            lines.append(
-                f"  - {cd.column_name}: {cd.distinct_count_before:,} → "
-                f"{cd.distinct_count_after:,} ({sign}{cd.distinct_count_delta:,})"
-            )
+        _head(lines, diff.cardinality_changes, 10, _fmt_cardinality_change)
 
     if not diff.has_changes:
         lines.append("\n✓ No significant changes detected")
@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import re
+import sys
+import traceback
+from typing import Any, Callable, Iterable, TypeVar
+
+import typer
+
+from kontra.cli.constants import EXIT_CONFIG_ERROR, EXIT_RUNTIME_ERROR
+from kontra.errors import ConfigError, ContractError, format_error_for_cli
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def parse_duration(duration_str: str) -> int:
@@ -26,3 +38,71 @@ def parse_duration(duration_str: str) -> int:
 
     multipliers = {"d": 86400, "h": 3600, "m": 60, "s": 1}
     return value * multipliers[unit]
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """
+    Write lines to stdout through a single block-buffered writer.
+
+    Large renders (e.g. diffs with thousands of rules) would otherwise hit
+    stdout once per line when it is line-buffered (TTY). Any pending output
+    on sys.stdout is flushed first so ordering with earlier echoes is kept.
+    """
+    stream = sys.stdout
+    raw = getattr(stream, "buffer", None)
+    if raw is None:
+        stream.write("".join(line + "\n" for line in lines))
+        stream.flush()
+        return
+
+    stream.flush()
+    out = io.TextIOWrapper(
+        raw,
+        encoding=getattr(stream, "encoding", None) or "utf-8",
+        errors=getattr(stream, "errors", None) or "strict",
+        line_buffering=False,
+        write_through=False,
+    )
+    try:
+        out.writelines(line + "\n" for line in lines)
+        out.flush()
+    finally:
+        # Detach so closing the wrapper never closes the real stdout buffer
+        out.detach()
+
+
+def cli_error_handler(fn: F) -> F:
+    """
+    Map uncaught command errors to a red message and a CLI exit code.
+
+    - typer.Exit passes through untouched
+    - FileNotFoundError, ContractError, ConfigError -> EXIT_CONFIG_ERROR
+    - anything else -> EXIT_RUNTIME_ERROR (with traceback when verbose=True)
+
+    Apply below `@app.command(...)`; commands must be invoked with keyword
+    arguments so the `verbose` flag is visible to the handler.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return fn(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except FileNotFoundError as e:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED)
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        except (ContractError, ConfigError) as e:
+            # Missing/invalid contract or config is a config error (exit 2),
+            # matching `kontra validate`. ContractNotFoundError is a KontraError,
+            # not a FileNotFoundError, so it must be caught explicitly.
+            typer.secho(f"Error: {format_error_for_cli(e)}", fg=typer.colors.RED)
+            raise typer.Exit(code=EXIT_CONFIG_ERROR)
+        except Exception as e:
+            msg = format_error_for_cli(e)
+            if kwargs.get("verbose"):
+                msg = f"{msg}\n\n{traceback.format_exc()}"
+            typer.secho(f"Error: {msg}", fg=typer.colors.RED)
+            raise typer.Exit(code=EXIT_RUNTIME_ERROR)
+
+    return wrapper  # type: ignore[return-value]
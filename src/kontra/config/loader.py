@@ -1,4 +1,6 @@
 from __future__ import annotations
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 import os
@@ -7,6 +9,30 @@ from kontra.config.models import Contract, RuleSpec
 from kontra.errors import ContractNotFoundError
 
 
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size) version."""
+    import yaml
+
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+def _read_yaml(path: Path) -> Any:
+    """
+    Return a private copy of the parsed YAML at `path`.
+
+    Parsing is memoized on the file's absolute path, mtime and size, so
+    repeated runs against an unchanged contract (SDK/server use) skip the YAML
+    parser. The path is resolved so a relative name cannot hit another
+    directory's entry after a cwd change. Callers get a deep copy because
+    `_resolve_extends` mutates the raw mapping.
+    """
+    resolved = path.resolve()
+    st = resolved.stat()
+    return deepcopy(_parse_yaml_file(str(resolved), st.st_mtime_ns, st.st_size))
+
+
 class ContractLoader:
     """Static helpers to load a Contract from different sources."""
 
@@ -19,13 +45,10 @@ class ContractLoader:
 
     @staticmethod
     def from_path(path: Union[str, Path]) -> Contract:
-        import yaml
-
         p = Path(path)
         if not p.exists():
             raise ContractNotFoundError(str(p))
-        with p.open("r") as f:
-            raw = yaml.safe_load(f)
+        raw = _read_yaml(p)
         # Resolve extends before parsing
         raw = ContractLoader._resolve_extends(raw, str(p.resolve()))
         return ContractLoader._parse_and_validate(raw, source=str(p))
@@ -101,10 +124,7 @@ class ContractLoader:
             if not resolved.exists():
                 raise ContractNotFoundError(str(resolved))
 
-            import yaml
-
-            with resolved.open("r") as f:
-                base_raw = yaml.safe_load(f)
+            base_raw = _read_yaml(resolved)
 
             if not isinstance(base_raw, dict):
                 raise ValueError(
@@ -20,7 +20,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, List, Optional, Sequence, Tuple
-from urllib.parse import unquote, urlparse
+from urllib.parse import unquote, urlsplit
 
 # Default HTTP port for the ClickHouse interface.
 _DEFAULT_HTTP_PORT = 8123
@@ -59,7 +59,7 @@ def resolve_connection_params(uri: str) -> ClickHouseConnectionParams:
     Raises:
         ValueError: If the URI is missing a database or table.
     """
-    parsed = urlparse(uri)
+    parsed = urlsplit(uri)
     secure = parsed.scheme == "clickhouses"
 
     host = parsed.hostname or "localhost"
@@ -13,7 +13,7 @@ import re
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
-from urllib.parse import urlparse, unquote
+from urllib.parse import urlparse, urlsplit, unquote
 import os
 
 if TYPE_CHECKING:
@@ -83,7 +83,7 @@ def resolve_connection_params(
     Raises:
         ValueError: If required parameters (database, table) cannot be resolved
     """
-    parsed = urlparse(uri)
+    parsed = urlsplit(uri)
 
     # Start with defaults
     host = config.default_host
@@ -138,23 +138,41 @@ def _apply_env_vars(
     config: DbConnectionConfig,
 ) -> Tuple[str, int, str, Optional[str], Optional[str]]:
     """Apply environment variables (Layer 1)."""
-    if os.getenv(config.env_host):
-        host = os.getenv(config.env_host, host)
-    if os.getenv(config.env_port):
+    env = _env_snapshot(
+        config.env_host,
+        config.env_port,
+        config.env_user,
+        config.env_password,
+        config.env_database,
+    )
+    if config.env_host in env:
+        host = env[config.env_host]
+    if config.env_port in env:
         try:
-            port = int(os.getenv(config.env_port, str(port)))
+            port = int(env[config.env_port])
         except ValueError:
             pass
-    if os.getenv(config.env_user):
-        user = os.getenv(config.env_user, user)
-    if os.getenv(config.env_password):
-        password = os.getenv(config.env_password)
-    if os.getenv(config.env_database):
-        database = os.getenv(config.env_database)
+    if config.env_user in env:
+        user = env[config.env_user]
+    if config.env_password in env:
+        password = env[config.env_password]
+    if config.env_database in env:
+        database = env[config.env_database]
 
     return host, port, user, password, database
 
 
+def _env_snapshot(*names: str) -> Dict[str, str]:
+    """Read `names` from the environment once, keeping only non-empty values."""
+    environ = os.environ
+    snapshot = {}
+    for name in names:
+        value = environ.get(name)
+        if value:
+            snapshot[name] = value
+    return snapshot
+
+
 def _apply_url_env_var(
     host: str,
     port: int,
@@ -168,7 +186,7 @@ def _apply_url_env_var(
     if not url_value:
         return host, port, user, password, database
 
-    db_parsed = urlparse(url_value)
+    db_parsed = urlsplit(url_value)
     if db_parsed.hostname:
         host = db_parsed.hostname
     if db_parsed.port:
@@ -217,17 +235,18 @@ def _parse_uri_path(
     schema = default_schema
     table: Optional[str] = None
 
-    path_parts = [p for p in path.strip("/").split("/") if p]
+    # Empty segments ("//") are skipped, so lstrip before each partition.
+    first, _, rest = path.strip("/").partition("/")
+    schema_table, _, _ = rest.lstrip("/").partition("/")
 
-    if len(path_parts) >= 1:
-        database = path_parts[0]
+    if first:
+        database = first
 
-    if len(path_parts) >= 2:
-        schema_table = path_parts[1]
-        if "." in schema_table:
-            schema, table = schema_table.split(".", 1)
+    if schema_table:
+        prefix, dot, name = schema_table.partition(".")
+        if dot:
+            schema, table = prefix, name
         else:
-            schema = default_schema
             table = schema_table
 
     return database, schema, table
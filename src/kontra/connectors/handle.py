@@ -29,10 +29,12 @@ the caller-owned `external_conn` used for BYOC.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 import os
 import re
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 # Re-export mask_credentials from db_utils for backward compatibility
 from kontra.connectors.db_utils import mask_credentials
@@ -241,19 +243,12 @@ class DatasetHandle:
           - `fs_opts` is populated from environment variables, then merged with
             storage_options (storage_options take precedence).
         """
-        parsed = urlparse(uri)
-        scheme = (parsed.scheme or "").lower()
-        lower = uri.lower()
-
-        # Very light format inference (enough for materializer selection)
-        if lower.endswith(".parquet"):
-            fmt = "parquet"
-        elif lower.endswith(".csv") or lower.endswith(".tsv"):
-            fmt = "csv"  # TSV is CSV with tab separator (auto-detected by Polars)
-        elif lower.endswith((".json", ".jsonl", ".ndjson")):
-            fmt = "json"
-        else:
-            fmt = "unknown"
+        scheme, fmt = _parse_location(uri)
+
+        # Local and HTTP(S) handles depend on nothing but the URI string, so
+        # they are built once and shared (the dataclass is frozen).
+        if scheme in _ENV_FREE_SCHEMES and not storage_options:
+            return _env_free_handle(uri)
 
         # Defaults: pass the original URI through to backends that accept URIs
         path = uri
@@ -308,6 +303,100 @@ class DatasetHandle:
 # ------------------------------ Helpers ---------------------------------------
 
 
+# Schemes whose handles carry no env-derived fs_opts or db_params.
+_ENV_FREE_SCHEMES = frozenset({"", "file", "http", "https"})
+
+
+# File extension (lowercase, no dot) -> format. Very light inference, enough
+# for materializer selection. TSV is CSV with a tab separator (auto-detected
+# by Polars).
+_FORMAT_BY_SUFFIX = {
+    "parquet": "parquet",
+    "csv": "csv",
+    "tsv": "csv",
+    "json": "json",
+    "jsonl": "json",
+    "ndjson": "json",
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_location(uri: str) -> Tuple[str, str]:
+    """Return (scheme, format) for a URI. Pure function of the string."""
+    # urlsplit already lowercases the scheme (and returns "" when absent).
+    scheme = urlsplit(uri).scheme
+    # Only the extension is lowercased, not the whole URI.
+    fmt = _FORMAT_BY_SUFFIX.get(uri.rpartition(".")[2].lower(), "unknown")
+    return scheme, fmt
+
+
+@lru_cache(maxsize=1024)
+def _env_free_handle(uri: str) -> DatasetHandle:
+    """Build (once per URI) the handle for a local / HTTP(S) location."""
+    scheme, fmt = _parse_location(uri)
+    return DatasetHandle(uri=uri, scheme=scheme, path=uri, format=fmt, fs_opts={})
+
+
+# S3 credential env vars and the fs_opts keys they map to. Read on every call
+# and never part of a cache key, so rotated secrets are not retained.
+_S3_CREDENTIAL_ENV = (
+    ("AWS_ACCESS_KEY_ID", "s3_access_key_id"),
+    ("AWS_SECRET_ACCESS_KEY", "s3_secret_access_key"),
+    ("AWS_SESSION_TOKEN", "s3_session_token"),
+)
+
+# Non-secret env vars consulted for S3/MinIO access, read together in one pass.
+_S3_ENV_KEYS = (
+    "DUCKDB_S3_REGION",
+    "AWS_REGION",
+    "DUCKDB_S3_ENDPOINT",
+    "AWS_ENDPOINT_URL",
+    "DUCKDB_S3_URL_STYLE",
+    "DUCKDB_S3_USE_SSL",
+    "DUCKDB_S3_MAX_CONNECTIONS",
+)
+
+
+@lru_cache(maxsize=8)
+def _normalize_s3_env(values: Tuple[Optional[str], ...]) -> Mapping[str, str]:
+    """Map raw non-secret S3 env values (ordered as `_S3_ENV_KEYS`) onto fs_opts keys."""
+    (duck_region, aws_region, duck_endpoint, aws_endpoint,
+     url_style, use_ssl, max_conns) = values
+
+    opts: Dict[str, str] = {}
+    # Region (prefer DUCKDB_S3_REGION when provided, else AWS_REGION, else default)
+    opts["s3_region"] = duck_region or aws_region or "us-east-1"
+    # Endpoint / style (MinIO/custom endpoints). Keep the full endpoint string;
+    # the DuckDB session factory will parse it.
+    endpoint = duck_endpoint or aws_endpoint
+    if endpoint:
+        opts["s3_endpoint"] = endpoint
+    if url_style:  # 'path' | 'host'
+        opts["s3_url_style"] = url_style
+    if use_ssl:  # 'true' | 'false'
+        opts["s3_use_ssl"] = use_ssl
+    opts["s3_max_connections"] = max_conns or "64"
+    return MappingProxyType(opts)
+
+
+def _s3_env_snapshot() -> Mapping[str, str]:
+    """
+    Return the normalized S3 options for the current environment.
+
+    The non-secret settings are normalized once per distinct env and memoized,
+    so repeated `from_uri("s3://...")` calls without credentials in the env
+    reuse one read-only mapping (each handle copies it into its own dict).
+    Credentials are read on every call and layered on top in a fresh mapping;
+    they never enter the cache.
+    """
+    environ = os.environ
+    public = _normalize_s3_env(tuple(environ.get(k) for k in _S3_ENV_KEYS))
+    creds = {opt: v for env, opt in _S3_CREDENTIAL_ENV if (v := environ.get(env))}
+    if not creds:
+        return public
+    return MappingProxyType({**creds, **public})
+
+
 def _inject_s3_env(opts: Dict[str, str]) -> None:
     """
     Read S3/MinIO-related environment variables and copy them into `opts` using
@@ -316,37 +405,7 @@ def _inject_s3_env(opts: Dict[str, str]) -> None:
     We *don’t* log or print these values anywhere; the caller just passes them to
     the backend session config. All keys are optional.
     """
-    # Credentials
-    ak = os.getenv("AWS_ACCESS_KEY_ID")
-    sk = os.getenv("AWS_SECRET_ACCESS_KEY")
-    st = os.getenv("AWS_SESSION_TOKEN")
-
-    # Region (prefer DUCKDB_S3_REGION when provided, else AWS_REGION, else default)
-    region = os.getenv("DUCKDB_S3_REGION") or os.getenv("AWS_REGION") or "us-east-1"
-
-    # Endpoint / style (MinIO/custom endpoints)
-    endpoint = os.getenv("DUCKDB_S3_ENDPOINT") or os.getenv("AWS_ENDPOINT_URL")
-    url_style = os.getenv("DUCKDB_S3_URL_STYLE")  # 'path' | 'host'
-    use_ssl = os.getenv("DUCKDB_S3_USE_SSL")      # 'true' | 'false'
-    max_conns = os.getenv("DUCKDB_S3_MAX_CONNECTIONS") or "64"
-
-    if ak:
-        opts["s3_access_key_id"] = ak
-    if sk:
-        opts["s3_secret_access_key"] = sk
-    if st:
-        opts["s3_session_token"] = st
-    if region:
-        opts["s3_region"] = region
-    if endpoint:
-        # Keep the full endpoint string; the DuckDB session factory will parse it.
-        opts["s3_endpoint"] = endpoint
-    if url_style:
-        opts["s3_url_style"] = url_style
-    if use_ssl:
-        opts["s3_use_ssl"] = use_ssl
-    if max_conns:
-        opts["s3_max_connections"] = str(max_conns)
+    opts.update(_s3_env_snapshot())
 
 
 def _inject_azure_env(opts: Dict[str, str]) -> None:
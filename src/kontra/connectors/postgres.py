@@ -40,9 +40,9 @@ _PG_CONFIG = DbConnectionConfig(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PostgresConnectionParams:
-    """Resolved PostgreSQL connection parameters."""
+    """Resolved PostgreSQL connection parameters (immutable once resolved)."""
 
     host: str
     port: int
@@ -55,7 +55,7 @@ import re
 import struct
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urlsplit
 
 from .db_utils import (
     DbConnectionConfig,
@@ -215,7 +215,7 @@ def resolve_connection_params(uri: str) -> SqlServerConnectionParams:
     """
     resolved = _resolve_params(uri, _MSSQL_CONFIG)
 
-    query = parse_qs(urlparse(uri).query)
+    query = parse_qs(urlsplit(uri).query)
 
     auth_raw = _first_query_value(query, "auth") or os.getenv("MSSQL_AUTH") or AUTH_SQL
     auth = validate_auth_mode(auth_raw)
@@ -8,6 +8,9 @@ engine, preplan, residual, and materializer modules.
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -17,15 +20,15 @@ if TYPE_CHECKING:
 
 def is_s3_uri(val: str | None) -> bool:
     """Check if value is an S3 URI."""
-    return isinstance(val, str) and val.lower().startswith("s3://")
+    # Lower only the prefix slice, not the whole (possibly long) URI
+    return isinstance(val, str) and val[:5].lower() == "s3://"
 
 
 def is_azure_uri(val: str | None) -> bool:
     """Check if URI is an Azure storage URI (ADLS Gen2 or Blob)."""
     if not isinstance(val, str):
         return False
-    lower = val.lower()
-    return lower.startswith(("abfs://", "abfss://", "az://"))
+    return val[:8].lower().startswith(("abfs://", "abfss://", "az://"))
 
 
 def validate_azure_account_key(key: str) -> None:
@@ -100,12 +103,12 @@ def azure_transport_option(fs_opts: "Optional[Dict[str, str]]" = None) -> Option
 
 def is_parquet(path: str | None) -> bool:
     """Check if path points to a Parquet file."""
-    return isinstance(path, str) and path.lower().endswith(".parquet")
+    return isinstance(path, str) and path[-8:].lower() == ".parquet"
 
 
 def s3_uri_to_path(uri: str) -> str:
     """Convert s3://bucket/key to bucket/key (PyArrow S3FileSystem format)."""
-    if uri.lower().startswith("s3://"):
+    if uri[:5].lower() == "s3://":
         return uri[5:]  # Strip 's3://'
     return uri
 
@@ -132,8 +135,6 @@ def create_s3_filesystem(handle: "DatasetHandle") -> "pafs.S3FileSystem":
     Create a PyArrow S3FileSystem from handle's fs_opts (populated from env vars).
     Supports MinIO and other S3-compatible storage via custom endpoints.
     """
-    import pyarrow.fs as pafs
-
     opts = handle.fs_opts or {}
 
     # Map our fs_opts keys to PyArrow S3FileSystem kwargs
@@ -168,7 +169,58 @@ def create_s3_filesystem(handle: "DatasetHandle") -> "pafs.S3FileSystem":
     elif opts.get("s3_endpoint"):
         kwargs["force_virtual_addressing"] = False
 
-    return pafs.S3FileSystem(**kwargs)
+    return _cached_s3_filesystem(kwargs)
+
+
+# PyArrow kwargs that carry credential material; never stored in a cache key.
+_S3_CREDENTIAL_KWARGS = ("access_key", "secret_key", "session_token")
+_S3_FS_CACHE_SIZE = 8
+_s3_fs_cache: "OrderedDict[tuple, pafs.S3FileSystem]" = OrderedDict()
+_s3_fs_lock = threading.Lock()
+
+
+def _cached_s3_filesystem(kwargs: Dict[str, Any]) -> "pafs.S3FileSystem":
+    """
+    One S3FileSystem per distinct option set, shared across runs.
+
+    Construction sets up an AWS client and connection pool; repeated
+    validations against the same bucket/credentials reuse it. Arrow
+    filesystems are thread-safe.
+
+    The key holds the non-secret options plus a SHA-256 digest of the
+    credentials, so rotated credentials form a new key without the raw
+    values living in the key. The cached filesystems themselves still hold
+    the credentials they were built with: at most ``_S3_FS_CACHE_SIZE`` of
+    them are retained (least recently used evicted first), and
+    ``_clear_s3_filesystem_cache()`` drops them all.
+    """
+    public = tuple(
+        sorted((k, v) for k, v in kwargs.items() if k not in _S3_CREDENTIAL_KWARGS)
+    )
+    creds = "\0".join(str(kwargs.get(k) or "") for k in _S3_CREDENTIAL_KWARGS)
+    key = (public, hashlib.sha256(creds.encode("utf-8")).hexdigest())
+
+    with _s3_fs_lock:
+        fs = _s3_fs_cache.get(key)
+        if fs is not None:
+            _s3_fs_cache.move_to_end(key)
+            return fs
+
+    import pyarrow.fs as pafs
+
+    fs = pafs.S3FileSystem(**kwargs)
+    with _s3_fs_lock:
+        fs = _s3_fs_cache.setdefault(key, fs)
+        _s3_fs_cache.move_to_end(key)
+        while len(_s3_fs_cache) > _S3_FS_CACHE_SIZE:
+            _s3_fs_cache.popitem(last=False)
+    return fs
+
+
+def _clear_s3_filesystem_cache() -> None:
+    """Drop all cached S3 filesystems (and the credentials they hold)."""
+    with _s3_fs_lock:
+        _s3_fs_cache.clear()
 
 
 def create_azure_filesystem(handle: "DatasetHandle") -> "pafs.FileSystem":
@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -57,8 +58,25 @@ def create_duckdb_connection(handle: DatasetHandle) -> duckdb.DuckDBPyConnection
     return con
 
 
+def ensure_extension(con: duckdb.DuckDBPyConnection, name: str) -> None:
+    """
+    Load a DuckDB extension, installing it at most once per process.
+
+    INSTALL is persistent (it writes to DuckDB's extension directory), so once
+    an extension has loaded successfully later connections only need LOAD.
+    If LOAD fails, the next call installs again.
+    """
+    if name not in _EXT_INSTALLED:
+        con.execute(f"INSTALL {name};")
+    con.execute(f"LOAD {name};")
+    _EXT_INSTALLED.add(name)
+
+
 # --- Internal Helpers ---
 
+# Extensions this process has installed and loaded at least once.
+_EXT_INSTALLED: set[str] = set()
+
 
 def _safe_set(con: duckdb.DuckDBPyConnection, key: str, value: Any) -> None:
     """
@@ -73,6 +91,101 @@ def _safe_set(con: duckdb.DuckDBPyConnection, key: str, value: Any) -> None:
         pass
 
 
+# Settings whose values are Kontra-derived or plain non-secret configuration.
+# Only these are rendered as literals into the (process-cached) batch SQL;
+# anything else, e.g. credentials or account names, is SET with a bound value.
+_BATCHABLE_SETTINGS = frozenset({
+    "enable_object_cache",
+    "enable_http_metadata_cache",
+    "s3_region",
+    "s3_endpoint",
+    "s3_use_ssl",
+    "s3_url_style",
+    "http_timeout",
+    "http_retries",
+    "http_retry_wait_ms",
+    "http_keep_alive",
+    "azure_transport_option_type",
+})
+
+
+class _SettingsBatch:
+    """
+    Collect DuckDB SET commands and apply them on exit.
+
+    Settings in `_BATCHABLE_SETTINGS` go out in a single execute(). If that
+    combined statement fails (e.g., one setting is unknown to this DuckDB
+    version), each is retried individually via `_safe_set`, so a bad key never
+    prevents the others from being applied. Any other key is always applied
+    individually as a bound parameter.
+    """
+
+    def __init__(self, con: duckdb.DuckDBPyConnection) -> None:
+        self.con = con
+        self.settings: List[Tuple[str, str]] = []
+
+    def set(self, key: str, value: Any) -> None:
+        self.settings.append((key, str(value)))
+
+    def extend(self, settings: Tuple[Tuple[str, Any], ...]) -> None:
+        self.settings.extend((key, str(value)) for key, value in settings)
+
+    def __enter__(self) -> "_SettingsBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def flush(self) -> None:
+        import duckdb
+
+        batched = tuple(s for s in self.settings if s[0] in _BATCHABLE_SETTINGS)
+        if batched:
+            try:
+                self.con.execute(_compile_set_sql(batched))
+            except duckdb.Error:
+                for key, value in batched:
+                    _safe_set(self.con, key, value)
+        for key, value in self.settings:
+            if key not in _BATCHABLE_SETTINGS:
+                _safe_set(self.con, key, value)
+        self.settings.clear()
+
+
+@lru_cache(maxsize=32)
+def _compile_set_sql(settings: Tuple[Tuple[str, str], ...]) -> str:
+    """
+    Render settings as one multi-statement SET string (values as literals).
+
+    The rendered SQL is cached for the life of the process, so only keys in
+    `_BATCHABLE_SETTINGS` are accepted.
+
+    Raises:
+        ValueError: a key outside `_BATCHABLE_SETTINGS` was passed.
+    """
+    rejected = [key for key, _ in settings if key not in _BATCHABLE_SETTINGS]
+    if rejected:
+        raise ValueError(f"Settings not allowed in a cached SET batch: {rejected}")
+    return "; ".join(
+        f"SET {key} = '{value.replace(chr(39), chr(39) * 2)}'" for key, value in settings
+    )
+
+
+# Which thread-count statement this DuckDB version accepts ("PRAGMA" for
+# older releases, "SET" for newer). Resolved on the first connection.
+_THREADS_SQL_FORM: Optional[str] = None
+
+
+@lru_cache(maxsize=4)
+def _thread_count(env_threads: Optional[str]) -> int:
+    """Resolve the DuckDB thread count from DUCKDB_THREADS or the CPU count."""
+    try:
+        return int(env_threads) if env_threads else (os.cpu_count() or 4)
+    except (ValueError, TypeError):
+        return os.cpu_count() or 4
+
+
 def _configure_threads(con: duckdb.DuckDBPyConnection) -> None:
     """
     Configure DuckDB thread count based on env vars or CPU count.
@@ -80,30 +193,51 @@ def _configure_threads(con: duckdb.DuckDBPyConnection) -> None:
     """
     import duckdb
 
-    env_threads = os.getenv("DUCKDB_THREADS")
-    try:
-        nthreads = int(env_threads) if env_threads else (os.cpu_count() or 4)
-    except (ValueError, TypeError):
-        nthreads = os.cpu_count() or 4
+    global _THREADS_SQL_FORM
+
+    nthreads = _thread_count(os.getenv("DUCKDB_THREADS"))
+    statements = {
+        "PRAGMA": f"PRAGMA threads={nthreads};",
+        "SET": f"SET threads = {nthreads};",
+    }
+    if _THREADS_SQL_FORM is not None:
+        try:
+            con.execute(statements[_THREADS_SQL_FORM])
+            return
+        except duckdb.Error:
+            pass  # e.g. DUCKDB_THREADS=0; probe both forms, ignoring failures
 
     # Try both PRAGMA (older) and SET (newer) for compatibility
-    for sql in (f"PRAGMA threads={int(nthreads)};", f"SET threads = {int(nthreads)};"):
+    for form, sql in statements.items():
         try:
             con.execute(sql)
+            _THREADS_SQL_FORM = form
             break
         except duckdb.Error:
             continue
 
 
+# Per-connection caches for remote reads: Parquet footers/objects, and HTTP
+# HEAD metadata so repeated scans of one file within a connection's lifetime
+# (view creation, LIMIT 0 schema probe, aggregates, COUNT) skip re-fetching.
+_HTTP_CACHE_SETTINGS: Tuple[Tuple[str, str], ...] = (
+    ("enable_object_cache", "true"),
+    ("enable_http_metadata_cache", "true"),
+)
+
+# fs_opts keys holding S3 secrets. Kept out of the memoized settings/SQL.
+_S3_CREDENTIAL_KEYS = ("s3_access_key_id", "s3_secret_access_key", "s3_session_token")
+
+
 def _configure_http(
     con: duckdb.DuckDBPyConnection, fs_opts: Dict[str, str]
 ) -> None:
     """
     Install and load the httpfs extension for reading http(s):// files.
     """
-    con.execute("INSTALL httpfs;")
-    con.execute("LOAD httpfs;")
-    _safe_set(con, "enable_object_cache", "true")
+    ensure_extension(con, "httpfs")
+    with _SettingsBatch(con) as settings:
+        settings.extend(_HTTP_CACHE_SETTINGS)
 
 
 def _configure_s3(con: duckdb.DuckDBPyConnection, fs_opts: Dict[str, str]) -> None:
@@ -120,19 +254,44 @@ def _configure_s3(con: duckdb.DuckDBPyConnection, fs_opts: Dict[str, str]) -> No
     - s3_session_token
     - s3_max_connections
     """
-    _configure_http(con, fs_opts)  # S3 depends on httpfs
+    ensure_extension(con, "httpfs")  # S3 depends on httpfs
+
+    # Connections in a batch almost always share fs_opts, so the derived
+    # settings (and their SQL) are computed once per distinct options set.
+    # They include the httpfs caches that _configure_http would set.
+    # Credentials are left out of that process-lifetime cache, so rotated
+    # keys are not retained, and are set per connection instead.
+    public_items = tuple(sorted(
+        (k, v) for k, v in fs_opts.items() if k not in _S3_CREDENTIAL_KEYS
+    ))
+    with _SettingsBatch(con) as settings:
+        settings.extend(_compile_s3_settings(public_items))
+    _set_s3_credentials(con, fs_opts)
+
+
+def _set_s3_credentials(con: duckdb.DuckDBPyConnection, fs_opts: Dict[str, str]) -> None:
+    """Apply S3 credentials as bound parameters (never rendered into cached SQL)."""
+    for key in _S3_CREDENTIAL_KEYS:
+        if value := fs_opts.get(key):
+            _safe_set(con, key, value)
+
+
+@lru_cache(maxsize=32)
+def _compile_s3_settings(
+    fs_opts_items: Tuple[Tuple[str, str], ...],
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Derive the ordered, credential-free DuckDB S3 settings for one set of fs_opts.
 
-    # Credentials
-    if ak := fs_opts.get("s3_access_key_id"):
-        _safe_set(con, "s3_access_key_id", ak)
-    if sk := fs_opts.get("s3_secret_access_key"):
-        _safe_set(con, "s3_secret_access_key", sk)
-    if st := fs_opts.get("s3_session_token"):
-        _safe_set(con, "s3_session_token", st)
+    Pure function of the options: endpoint parsing, SSL inference and
+    url_style defaulting happen here rather than on every connection.
+    """
+    fs_opts = dict(fs_opts_items)
+    settings: List[Tuple[str, str]] = list(_HTTP_CACHE_SETTINGS)
 
     # Region
     if region := fs_opts.get("s3_region"):
-        _safe_set(con, "s3_region", region)
+        settings.append(("s3_region", region))
 
     # Endpoint (MinIO/S3-compatible)
     endpoint = fs_opts.get("s3_endpoint")
@@ -141,29 +300,31 @@ def _configure_s3(con: duckdb.DuckDBPyConnection, fs_opts: Dict[str, str]) -> No
 
     if endpoint:
         # Parse "http://host:port" or just "host:port"
-        parsed = urlparse(endpoint)
+        parsed = urlsplit(endpoint)
         hostport = parsed.netloc or parsed.path or endpoint
-        _safe_set(con, "s3_endpoint", hostport)
+        settings.append(("s3_endpoint", hostport))
 
         # Infer SSL from endpoint scheme if not explicitly set
         if use_ssl is None:
             use_ssl = "true" if parsed.scheme == "https" else "false"
-        _safe_set(con, "s3_use_ssl", use_ssl)
+        settings.append(("s3_use_ssl", use_ssl))
 
         # Default to path-style for custom endpoints (MinIO-friendly)
         if url_style is None:
             url_style = "path"
 
     if url_style:
-        _safe_set(con, "s3_url_style", url_style)
+        settings.append(("s3_url_style", url_style))
 
     # Performance and reliability for large files over S3/HTTP
     # http_timeout is in seconds (default 30s - increase for large files)
-    _safe_set(con, "http_timeout", "600")  # 10 minutes for large files
-    _safe_set(con, "http_retries", "5")    # More retries for reliability
-    _safe_set(con, "http_retry_wait_ms", "2000")  # 2s between retries
+    settings.append(("http_timeout", "600"))  # 10 minutes for large files
+    settings.append(("http_retries", "5"))  # More retries for reliability
+    settings.append(("http_retry_wait_ms", "2000"))  # 2s between retries
     # Disable keep-alive for MinIO/S3-compatible - connection pooling can cause issues
-    _safe_set(con, "http_keep_alive", "false")
+    settings.append(("http_keep_alive", "false"))
+
+    return tuple(settings)
 
 
 def _configure_azure(
@@ -190,8 +351,7 @@ def _configure_azure(
     """
     # Install and load the Azure extension
     try:
-        con.execute("INSTALL azure;")
-        con.execute("LOAD azure;")
+        ensure_extension(con, "azure")
     except Exception as e:
         raise RuntimeError(
             f"Azure extension not available. DuckDB >= 0.10.0 is required for Azure support. "
@@ -207,68 +367,69 @@ def _configure_azure(
     client_secret = fs_opts.get("azure_client_secret")
     endpoint = fs_opts.get("azure_endpoint")
 
-    # Build connection string for DuckDB secret
-    # Priority: explicit connection_string > account_key > sas_token > service_principal
-    if conn_string:
-        # User provided full connection string
-        _create_azure_secret(con, conn_string)
-    elif account_name and account_key:
-        # Account key auth. Validate base64 shape first: the key is embedded
-        # in a ';'-delimited connection string, and DuckDB's own failure for
-        # a malformed key is an opaque HTTP error at query time.
-        from kontra.connectors.uri_utils import validate_azure_account_key
-
-        validate_azure_account_key(account_key)
-        cs = f"DefaultEndpointsProtocol=https;AccountName={account_name};AccountKey={account_key}"
-        if endpoint:
-            cs += f";BlobEndpoint={endpoint}"
-        _create_azure_secret(con, cs)
-    elif account_name and sas_token:
-        # SAS token auth - strip leading '?' if present
-        if sas_token.startswith("?"):
-            sas_token = sas_token[1:]
-        cs = f"DefaultEndpointsProtocol=https;AccountName={account_name};SharedAccessSignature={sas_token}"
-        if endpoint:
-            cs += f";BlobEndpoint={endpoint}"
-        _create_azure_secret(con, cs)
-    elif tenant_id and client_id and client_secret:
-        # Service principal auth - use credential chain
-        _safe_set(con, "azure_account_name", account_name or "")
-        # Set up credential chain for service principal.
-        # Escape single quotes so an account_name containing a quote cannot
-        # break out of the SQL string literal (same escaping as _create_azure_secret).
-        escaped_account = (account_name or "").replace("'", "''")
-        con.execute(f"""
-            CREATE SECRET azure_sp (
-                TYPE AZURE,
-                PROVIDER CREDENTIAL_CHAIN,
-                ACCOUNT_NAME '{escaped_account}'
-            )
-        """)
-        # Set the environment variables for the credential chain to pick up
-        os.environ.setdefault("AZURE_TENANT_ID", tenant_id)
-        os.environ.setdefault("AZURE_CLIENT_ID", client_id)
-        os.environ.setdefault("AZURE_CLIENT_SECRET", client_secret)
-    elif account_name:
-        # Just account name - try credential chain (CLI, managed identity, etc.)
-        _safe_set(con, "azure_account_name", account_name)
-
-    # Custom endpoint for Azurite/sovereign clouds
-    if endpoint and not conn_string and not (account_name and (account_key or sas_token)):
-        _safe_set(con, "azure_endpoint", endpoint)
-
-    # Transport adapter: the SDK default can't find CA bundles in many
-    # container images; 'curl' searches the standard paths (Linux default).
-    from kontra.connectors.uri_utils import azure_transport_option
-
-    transport = azure_transport_option(fs_opts)
-    if transport:
-        _safe_set(con, "azure_transport_option_type", transport)
-
-    # Performance settings (same as S3)
-    _safe_set(con, "http_timeout", "600")  # 10 minutes for large files
-    _safe_set(con, "http_retries", "5")
-    _safe_set(con, "http_retry_wait_ms", "2000")
+    with _SettingsBatch(con) as settings:
+        # Build connection string for DuckDB secret
+        # Priority: explicit connection_string > account_key > sas_token > service_principal
+        if conn_string:
+            # User provided full connection string
+            _create_azure_secret(con, conn_string)
+        elif account_name and account_key:
+            # Account key auth. Validate base64 shape first: the key is embedded
+            # in a ';'-delimited connection string, and DuckDB's own failure for
+            # a malformed key is an opaque HTTP error at query time.
+            from kontra.connectors.uri_utils import validate_azure_account_key
+
+            validate_azure_account_key(account_key)
+            cs = f"DefaultEndpointsProtocol=https;AccountName={account_name};AccountKey={account_key}"
+            if endpoint:
+                cs += f";BlobEndpoint={endpoint}"
+            _create_azure_secret(con, cs)
+        elif account_name and sas_token:
+            # SAS token auth - strip leading '?' if present
+            if sas_token.startswith("?"):
+                sas_token = sas_token[1:]
+            cs = f"DefaultEndpointsProtocol=https;AccountName={account_name};SharedAccessSignature={sas_token}"
+            if endpoint:
+                cs += f";BlobEndpoint={endpoint}"
+            _create_azure_secret(con, cs)
+        elif tenant_id and client_id and client_secret:
+            # Service principal auth - use credential chain
+            settings.set("azure_account_name", account_name or "")
+            # Set up credential chain for service principal.
+            # Escape single quotes so an account_name containing a quote cannot
+            # break out of the SQL string literal (same escaping as _create_azure_secret).
+            escaped_account = (account_name or "").replace("'", "''")
+            con.execute(f"""
+                CREATE SECRET azure_sp (
+                    TYPE AZURE,
+                    PROVIDER CREDENTIAL_CHAIN,
+                    ACCOUNT_NAME '{escaped_account}'
+                )
+            """)
+            # Set the environment variables for the credential chain to pick up
+            os.environ.setdefault("AZURE_TENANT_ID", tenant_id)
+            os.environ.setdefault("AZURE_CLIENT_ID", client_id)
+            os.environ.setdefault("AZURE_CLIENT_SECRET", client_secret)
+        elif account_name:
+            # Just account name - try credential chain (CLI, managed identity, etc.)
+            settings.set("azure_account_name", account_name)
+
+        # Custom endpoint for Azurite/sovereign clouds
+        if endpoint and not conn_string and not (account_name and (account_key or sas_token)):
+            settings.set("azure_endpoint", endpoint)
+
+        # Transport adapter: the SDK default can't find CA bundles in many
+        # container images; 'curl' searches the standard paths (Linux default).
+        from kontra.connectors.uri_utils import azure_transport_option
+
+        transport = azure_transport_option(fs_opts)
+        if transport:
+            settings.set("azure_transport_option_type", transport)
+
+        # Performance settings (same as S3)
+        settings.set("http_timeout", "600")  # 10 minutes for large files
+        settings.set("http_retries", "5")
+        settings.set("http_retry_wait_ms", "2000")
 
 
 def _create_azure_secret(con: duckdb.DuckDBPyConnection, connection_string: str) -> None:
@@ -57,7 +57,8 @@ class PolarsBackend:
 
     def introspect(self, df: pl.DataFrame) -> Dict[str, Any]:
         """Basic observability: row count and available columns."""
+        # df.columns already returns a fresh list; no second copy needed.
         return {
-            "row_count": int(df.height),
-            "available_cols": list(df.columns),
+            "row_count": df.height,
+            "available_cols": df.columns,
         }
@@ -8,8 +8,8 @@ Flow
   1) Load contract
   2) Build rules → compile plan (required columns + SQL-capable candidates)
   3) (Optional) Preplan (metadata-only, Parquet): prove PASS/FAIL, build scan manifest
-  4) Pick materializer (e.g., DuckDB for S3 / staged CSV)
-  5) (Optional) SQL pushdown for eligible *remaining* rules (may stage CSV → Parquet)
+  4) (Optional) SQL pushdown for eligible *remaining* rules (may stage CSV → Parquet)
+  5) Pick materializer (e.g., DuckDB for S3 / staged CSV)
   6) Materialize residual slice for Polars (row-groups + projection)
   7) Execute residual rules in Polars
   8) Merge results (preplan → SQL → Polars), summarize, attach small stats dict
@@ -25,7 +25,6 @@ Principles
 - Clear separation: engine orchestrates; preplan is a leaf; reporters format/print
 """
 
-import os
 from pathlib import Path
 from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Union
 
@@ -52,7 +51,7 @@ from kontra.engine.materializers.registry import (
     register_materializers_for_path,
 )
 from kontra.engine.paths import ExecutionPath, get_database_type
-from kontra.engine.stats import RunTimers, basic_summary, columns_touched, now_ms, profile_for
+from kontra.engine.stats import RunTimers, basic_summary, columns_touched_from_rules, profile_for
 from kontra.connectors.uri_utils import (
     is_s3_uri as _is_s3_uri,
     is_azure_uri as _is_azure_uri,
@@ -60,7 +59,6 @@ from kontra.connectors.uri_utils import (
     create_s3_filesystem as _create_s3_filesystem,
     create_azure_filesystem as _create_azure_filesystem,
 )
-from kontra.reporters.rich_reporter import report_failure, report_line, report_success
 from kontra.rule_defs.execution_plan import RuleExecutionPlan
 from kontra.logging import get_logger, log_exception
 
@@ -682,31 +680,28 @@ class ValidationEngine:
         - Skips SQL pushdown (data already in memory)
         - Uses Polars-only execution
         """
-        t0 = now_ms()
-
-        # Convert pandas to polars if needed
-        pl = _get_polars()
-        df = self._input_dataframe
-        if not isinstance(df, pl.DataFrame):
-            try:
-                # Assume it's pandas-like
-                df = pl.from_pandas(df)
-            except Exception as e:
-                raise ValueError(
-                    f"Could not convert DataFrame to Polars: {e}. "
-                    "Pass a Polars DataFrame or a pandas DataFrame."
-                )
+        with timers.phase("data_load"):
+            # Convert pandas to polars if needed
+            pl = _get_polars()
+            df = self._input_dataframe
+            if not isinstance(df, pl.DataFrame):
+                try:
+                    # Assume it's pandas-like
+                    df = pl.from_pandas(df)
+                except Exception as e:
+                    raise ValueError(
+                        f"Could not convert DataFrame to Polars: {e}. "
+                        "Pass a Polars DataFrame or a pandas DataFrame."
+                    )
 
-        self.df = df
-        timers.data_load_ms = now_ms() - t0
+            self.df = df
 
         # Execute all rules via Polars
-        t0 = now_ms()
-        PolarsBackend = _get_polars_backend()
-        polars_exec = PolarsBackend(executor=plan.execute_compiled)
-        exec_result = polars_exec.execute(self.df, compiled_full, rule_tally_map)
-        polars_results = exec_result.get("results", [])
-        timers.polars_ms = now_ms() - t0
+        with timers.phase("polars"):
+            PolarsBackend = _get_polars_backend()
+            polars_exec = PolarsBackend(executor=plan.execute_compiled)
+            exec_result = polars_exec.execute(self.df, compiled_full, rule_tally_map)
+            polars_results = exec_result.get("results", [])
 
         # Merge results (all from Polars in this mode)
         all_results: List[Dict[str, Any]] = []
@@ -866,8 +861,8 @@ class ValidationEngine:
         3. DataFrame mode (early exit if user provided DataFrame)
         4. Handle resolution
         5. Preplan (metadata-only optimization)
-        6. Materializer setup
-        7. SQL pushdown
+        6. SQL pushdown
+        7. Materializer setup
         8. Residual Polars execution
         9. Result merging
         10. Summary and reporting
@@ -876,24 +871,22 @@ class ValidationEngine:
         # ------------------------------------------------------------------ #
         # Phase 1: Contract Loading
         # ------------------------------------------------------------------ #
-        t0 = now_ms()
-        self.contract = self._load_contract()
-        timers.contract_load_ms = now_ms() - t0
+        with timers.phase("contract_load"):
+            self.contract = self._load_contract()
 
         # ------------------------------------------------------------------ #
         # Phase 2: Rule Compilation
         # ------------------------------------------------------------------ #
-        t0 = now_ms()
-        ctx = compile_rules(
-            contract=self.contract,
-            inline_built_rules=self._inline_built_rules,
-            global_tally=self.tally,
-            tally_is_override=self.tally_is_override,
-            only_rules=self._only_rules,
-            only_columns=self._only_columns,
-        )
-        self._rules = ctx.rules  # Store for sample_failures()
-        timers.compile_ms = now_ms() - t0
+        with timers.phase("compile"):
+            ctx = compile_rules(
+                contract=self.contract,
+                inline_built_rules=self._inline_built_rules,
+                global_tally=self.tally,
+                tally_is_override=self.tally_is_override,
+                only_rules=self._only_rules,
+                only_columns=self._only_columns,
+            )
+            self._rules = ctx.rules  # Store for sample_failures()
 
         # ------------------------------------------------------------------ #
         # Phase 3: DataFrame Mode (early exit)
@@ -931,13 +924,7 @@ class ValidationEngine:
         )
 
         # ------------------------------------------------------------------ #
-        # Phase 6: Materializer Setup
-        # ------------------------------------------------------------------ #
-        materializer = pick_materializer(handle)
-        materializer_name = getattr(materializer, "name", "duckdb")
-
-        # ------------------------------------------------------------------ #
-        # Phase 7: SQL Pushdown
+        # Phase 6: SQL Pushdown
         # ------------------------------------------------------------------ #
         pushdown, handle, staging_tmpdir = execute_pushdown(
             handle=handle,
@@ -951,10 +938,13 @@ class ValidationEngine:
         )
         self._staging_tmpdir = staging_tmpdir
 
-        # Update materializer if handle changed (CSV staged to Parquet)
-        if pushdown.staged_path:
-            materializer = pick_materializer(handle)
-            materializer_name = getattr(materializer, "name", materializer_name)
+        # ------------------------------------------------------------------ #
+        # Phase 7: Materializer Setup
+        # ------------------------------------------------------------------ #
+        # Picked after pushdown so it is built once, against the final handle
+        # (pushdown may swap a CSV source for its staged Parquet copy).
+        materializer = pick_materializer(handle)
+        materializer_name = getattr(materializer, "name", "duckdb")
 
         # ------------------------------------------------------------------ #
         # Phase 8: Residual Polars Execution
@@ -998,9 +988,8 @@ class ValidationEngine:
         )
 
         if self.emit_report:
-            t0 = now_ms()
-            self._report(summary, results)
-            timers.report_ms = now_ms() - t0
+            with timers.phase("report"):
+                self._report(summary, results)
 
         # ------------------------------------------------------------------ #
         # Phase 11: Stats Collection
@@ -1046,14 +1035,14 @@ class ValidationEngine:
         """Collect validation statistics for stats_mode='summary' or 'profile'."""
         available_cols = pushdown.available_cols
         if not available_cols:
-            available_cols = self._peek_available_columns(handle.uri)
+            available_cols = self._peek_available_columns(handle.uri, materializer)
 
         ds_summary = basic_summary(self.df, available_cols=available_cols, nrows_override=pushdown.row_count)
 
         loaded_cols = list(self.df.columns) if self.df is not None else []
         required_cols_full = ctx.compiled_full.required_cols if self.enable_projection else []
-        compiled_residual = ctx.plan.without_ids(ctx.compiled_full, preplan.handled_ids | pushdown.handled_ids)
-        required_cols_residual = compiled_residual.required_cols if self.enable_projection else []
+        # The residual phase already derived this from its pruned plan
+        required_cols_residual = residual.required_cols
 
         proj = {
             "enabled": self.enable_projection,
@@ -1088,15 +1077,17 @@ class ValidationEngine:
         }
 
         phases_ms = {
-            "contract_load": int(timers.contract_load_ms or 0),
-            "compile": int(timers.compile_ms or 0),
-            "preplan": int(preplan.analyze_ms or 0),
-            "pushdown": int(pushdown.compile_ms + pushdown.execute_ms + pushdown.introspect_ms),
-            "data_load": int(timers.data_load_ms or 0),
-            "execute": int(timers.execute_ms or 0),
-            "report": int(timers.report_ms or 0),
+            "contract_load": timers.contract_load_ms,
+            "compile": timers.compile_ms,
+            "preplan": preplan.analyze_ms,
+            "pushdown": pushdown.compile_ms + pushdown.execute_ms + pushdown.introspect_ms,
+            "data_load": timers.data_load_ms,
+            "execute": timers.execute_ms,
+            "report": timers.report_ms,
         }
 
+        touched = columns_touched_from_rules(self.contract.rules)
+
         stats: Dict[str, Any] = {
             "stats_version": "2",
             "run_meta": {
@@ -1118,26 +1109,31 @@ class ValidationEngine:
             "pushdown": push,
             "projection": proj,
             "residual": res,
-            "columns_touched": columns_touched([{"name": r.name, "params": r.params} for r in self.contract.rules]),
-            "columns_validated": columns_touched([{"name": r.name, "params": r.params} for r in self.contract.rules]),
+            "columns_touched": touched,
+            "columns_validated": list(touched),
             "columns_loaded": loaded_cols,
         }
 
         if self.stats_mode == "profile" and self.df is not None:
             stats["profile"] = profile_for(self.df, proj["residual"]["required_columns"])
 
-        if os.getenv("KONTRA_IO_DEBUG"):
-            io_dbg = getattr(materializer, "io_debug", None)
-            if callable(io_dbg):
-                io = io_dbg()
-                if io:
-                    stats["io"] = io
+        # Materializers read KONTRA_IO_DEBUG when they are built and only
+        # record diagnostics when it is set; otherwise io_debug() is None.
+        io_dbg = getattr(materializer, "io_debug", None)
+        if callable(io_dbg):
+            io = io_dbg()
+            if io:
+                stats["io"] = io
 
         return stats
 
     # --------------------------------------------------------------------- #
 
     def _report(self, summary: Dict[str, Any], results: List[Dict[str, Any]]) -> None:
+        # Deferred: rich is only needed when the engine prints (CLI runs),
+        # not for SDK callers constructing the engine.
+        from kontra.reporters.rich_reporter import report_failure, report_lines, report_success
+
         if summary["passed"]:
             # Show warning/info counts if any
             warning_info = ""
@@ -1169,7 +1165,8 @@ class ValidationEngine:
                 f"({summary['rules_failed']} of {summary['total_rules']} rules){severity_info}"
             )
 
-        # Show all rule results with execution source
+        # Show all rule results with execution source, written in one batch
+        lines: List[str] = []
         for r in results:
             source = r.get("execution_source", "polars")
             source_tag = f" [{source}]" if source else ""
@@ -1183,7 +1180,7 @@ class ValidationEngine:
                 severity_tag = f" [{severity}]"
 
             if passed:
-                report_line(f"  ✅ {rule_id}{source_tag}")
+                lines.append(f"  ✅ {rule_id}{source_tag}")
             else:
                 msg = r.get("message", "Failed")
                 failed_count = r.get("failed_count", 0)
@@ -1208,41 +1205,55 @@ class ValidationEngine:
 
                 # Use different icon for warning/info
                 icon = "❌" if severity == "blocking" else ("⚠️" if severity == "warning" else "ℹ️")
-                report_line(f"  {icon} {rule_id}{source_tag}{severity_tag}{detail}")
+                lines.append(f"  {icon} {rule_id}{source_tag}{severity_tag}{detail}")
 
                 # Show detailed explanation if available
                 details = r.get("details")
                 if details:
-                    self._print_failure_details(details)
+                    self._append_failure_details(lines, details)
+
+        report_lines(lines)
 
-    def _print_failure_details(self, details: Dict[str, Any]) -> None:
-        """Print detailed failure explanation."""
+    def _append_failure_details(self, lines: List[str], details: Dict[str, Any]) -> None:
+        """Append detailed failure explanation lines."""
         # Expected values (for allowed_values rule)
         expected = details.get("expected")
         if expected:
             expected_preview = ", ".join(expected[:5])
             if len(expected) > 5:
                 expected_preview += f" ... ({len(expected)} total)"
-            report_line(f"     Expected: {expected_preview}")
+            lines.append(f"     Expected: {expected_preview}")
 
         unexpected = details.get("unexpected_values")
         if unexpected:
-            report_line("     Unexpected values:")
+            lines.append("     Unexpected values:")
             for uv in unexpected[:5]:
                 val = uv.get("value", "?")
                 count = uv.get("count", 0)
-                report_line(f"       - \"{val}\" ({count:,} rows)")
+                lines.append(f"       - \"{val}\" ({count:,} rows)")
             if len(unexpected) > 5:
-                report_line(f"       ... and {len(unexpected) - 5} more")
+                lines.append(f"       ... and {len(unexpected) - 5} more")
 
         suggestion = details.get("suggestion")
         if suggestion:
-            report_line(f"     Suggestion: {suggestion}")
+            lines.append(f"     Suggestion: {suggestion}")
 
     # --------------------------------------------------------------------- #
 
-    def _peek_available_columns(self, source: str) -> List[str]:
-        """Cheap schema peek; used only for observability."""
+    def _peek_available_columns(self, source: str, materializer: Any = None) -> List[str]:
+        """Cheap schema peek; used only for observability.
+
+        Prefers the materializer's own schema(), which reuses its open
+        connection/filesystem instead of re-opening the source.
+        """
+        schema = getattr(materializer, "schema", None)
+        if callable(schema):
+            try:
+                cols = schema()
+                if cols:
+                    return list(cols)
+            except Exception as e:
+                log_exception(_logger, f"Materializer schema peek failed for {source}", e)
         try:
             s = source.lower()
             # We can't easily peek S3 without a filesystem object,
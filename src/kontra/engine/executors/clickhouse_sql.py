@@ -34,14 +34,15 @@ class ClickHouseSqlExecutor(DatabaseSqlExecutor):
     """
 
     DIALECT = "clickhouse"
-    SUPPORTED_RULES = {
+    SUPPORTED_RULES = frozenset({
         "not_null", "unique", "min_rows", "max_rows",
         "allowed_values", "disallowed_values",
         "freshness", "range", "length", "regex",
         "contains", "starts_with", "ends_with",
         "compare", "conditional_not_null", "conditional_range",
         "custom_sql_check", "custom_agg",
-    }
+    })
+    SUPPORTED_SCHEMES = frozenset({"clickhouse", "clickhouses"})
 
     # \w \W \d \D \s \S \b \B mean ASCII in ClickHouse's RE2 but Unicode in
     # Polars' regex crate, so a pattern using them can flip pass/fail between
@@ -64,7 +65,7 @@ class ClickHouseSqlExecutor(DatabaseSqlExecutor):
     def _supports_scheme(self, scheme: str, handle: DatasetHandle) -> bool:
         if scheme == "byoc" and handle.dialect == "clickhouse":
             return handle.external_conn is not None
-        return scheme in {"clickhouse", "clickhouses"}
+        return scheme in self.SUPPORTED_SCHEMES
 
     @contextmanager
     def _get_connection_ctx(self, handle: DatasetHandle):
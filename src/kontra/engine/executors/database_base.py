@@ -8,6 +8,7 @@ reducing code duplication between database-specific executors.
 Each subclass must define:
   - DIALECT: "postgres" or "sqlserver"
   - SUPPORTED_RULES: Set of rule kinds this executor supports
+  - SUPPORTED_SCHEMES: URI schemes this executor accepts (besides BYOC)
   - _get_connection_ctx(): Connection context manager
   - _get_table_reference(): Fully-qualified table reference
 """
@@ -16,7 +17,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Tuple
 
 from kontra.connectors.handle import DatasetHandle
 from kontra.engine.sql_utils import (
@@ -55,6 +56,7 @@ from kontra.engine.sql_utils import (
     exists_custom,
     # Utilities
     results_from_row,
+    plan_rule_kinds,
     Dialect,
 )
 from kontra.engine.sql_validator import validate_sql, replace_table_placeholder, to_count_query
@@ -75,8 +77,12 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
 
     # Subclasses must define these
     DIALECT: Dialect
-    SUPPORTED_RULES: Set[str]
+    SUPPORTED_RULES: FrozenSet[str]
+    SUPPORTED_SCHEMES: FrozenSet[str]
     INCLUDE_ROW_COUNT_IN_AGGREGATE = False
+    # When both phases run, evaluate the EXISTS checks as uncorrelated
+    # subqueries in the aggregate's select list (one round-trip, not two).
+    COMBINE_EXISTS_WITH_AGGREGATE = False
 
     @property
     @abstractmethod
@@ -192,6 +198,7 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
                 "aggregate_specs": [...],   # Phase 2: specs for aggregates
                 "custom_sql_specs": [...],  # Phase 3: custom SQL queries
                 "supported_specs": [...],   # All supported specs
+                "rule_kinds": {...},        # rule_id -> kind, for result parsing
             }
         """
         exists_specs: List[Dict[str, Any]] = []
@@ -448,6 +455,7 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
             "aggregate_specs": aggregate_specs,
             "custom_sql_specs": custom_sql_specs,
             "supported_specs": supported_specs,
+            "rule_kinds": {s["rule_id"]: s.get("kind") for s in supported_specs},
         }
 
     def execute(
@@ -477,21 +485,14 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
         results: List[Dict[str, Any]] = []
         row_count = None
 
-        # Build rule_kinds mapping from specs
-        rule_kinds = {}
-        for spec in exists_specs:
-            rule_kinds[spec["rule_id"]] = spec.get("kind")
-        for spec in compiled_plan.get("aggregate_specs", []):
-            rule_kinds[spec["rule_id"]] = spec.get("kind")
-        for spec in custom_sql_specs:
-            rule_kinds[spec["rule_id"]] = spec.get("kind")
+        rule_kinds = plan_rule_kinds(compiled_plan)
 
         with self._get_connection_ctx(handle) as conn:
             cursor = self._get_cursor(conn)
             try:
                 # Phase 1: EXISTS checks (early termination for tally=False)
+                exists_exprs: List[str] = []
                 if exists_specs:
-                    exists_exprs = []
                     for spec in exists_specs:
                         kind = spec.get("kind")
                         rid = spec.get("rule_id")
@@ -538,19 +539,26 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
                             if exists_condition:
                                 exists_exprs.append(exists_custom(exists_condition, table, rid, self.DIALECT))
 
-                    if exists_exprs:
-                        exists_sql = self._assemble_exists_query(exists_exprs)
-                        cursor.execute(exists_sql)
-                        row = cursor.fetchone()
-                        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                # Leading EXISTS columns carried by the aggregate query, if combined
+                combined_exists = (
+                    exists_exprs
+                    if self.COMBINE_EXISTS_WITH_AGGREGATE and aggregate_selects
+                    else []
+                )
 
-                        if row and columns:
-                            exists_results = results_from_row(columns, row, is_exists=True, rule_kinds=rule_kinds)
-                            results.extend(exists_results)
+                if exists_exprs and not combined_exists:
+                    exists_sql = self._assemble_exists_query(exists_exprs)
+                    cursor.execute(exists_sql)
+                    row = cursor.fetchone()
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+
+                    if row and columns:
+                        exists_results = results_from_row(columns, row, is_exists=True, rule_kinds=rule_kinds)
+                        results.extend(exists_results)
 
                 # Phase 2: Aggregate query for remaining rules
                 if aggregate_selects:
-                    selects = list(aggregate_selects)
+                    selects = [*combined_exists, *aggregate_selects]
                     if self.INCLUDE_ROW_COUNT_IN_AGGREGATE:
                         # PostgreSQL tally queries already scan the relation. Folding
                         # the total into that scan avoids a second COUNT(*) round-trip.
@@ -572,9 +580,17 @@ class DatabaseSqlExecutor(SqlExecutor, ABC):
                             row_count = int(raw_row_count) if raw_row_count is not None else 0
                             result_columns = columns[:row_count_index]
                             result_row = tuple(row[:row_count_index])
+                        n_exists = len(combined_exists)
+                        if n_exists:
+                            results.extend(results_from_row(
+                                result_columns[:n_exists],
+                                tuple(result_row[:n_exists]),
+                                is_exists=True,
+                                rule_kinds=rule_kinds,
+                            ))
                         agg_results = results_from_row(
-                            result_columns,
-                            result_row,
+                            result_columns[n_exists:],
+                            tuple(result_row[n_exists:]),
                             is_exists=False,
                             rule_kinds=rule_kinds,
                         )
@@ -27,7 +27,10 @@ from kontra.logging import get_logger
 _logger = get_logger(__name__)
 
 # --- Kontra Imports ---
-from kontra.engine.backends.duckdb_session import create_duckdb_connection
+from kontra.engine.backends.duckdb_session import (
+    create_duckdb_connection,
+    ensure_extension,
+)
 from kontra.engine.backends.duckdb_utils import esc_ident, lit_str
 from kontra.connectors.handle import DatasetHandle
 from kontra.connectors.uri_utils import is_azure_uri
@@ -67,6 +70,7 @@ from kontra.engine.sql_utils import (
     exists_custom,
     # Utilities
     results_from_row,
+    plan_rule_kinds,
     SQL_OP_MAP,
     RULE_KIND_TO_FAILURE_MODE,
 )
@@ -145,8 +149,7 @@ def _is_csv(handle: DatasetHandle) -> bool:
 def _install_httpfs(con: duckdb.DuckDBPyConnection, handle: DatasetHandle) -> None:
     scheme = (handle.scheme or "").lower()
     if scheme in {"s3", "http", "https"}:
-        con.execute("INSTALL httpfs;")
-        con.execute("LOAD httpfs;")
+        ensure_extension(con, "httpfs")
 
 
 def _stage_csv_to_parquet_with_duckdb(
@@ -302,36 +305,15 @@ DIALECT = "duckdb"
 
 
 def _assemble_single_row(selects: List[str]) -> str:
+    """
+    Combine scalar aggregate expressions into one SELECT over `_data`.
+
+    All aggregates share a single scan and a single aggregation pipeline,
+    matching the database executors' `_assemble_single_row`.
+    """
     if not selects:
         return "SELECT 0 AS __no_sql_rules__ LIMIT 1;"
-    ctes, aliases = [], []
-    for i, sel in enumerate(selects):
-        nm = f"a{i}"
-        ctes.append(f"{nm} AS (SELECT {sel} FROM _data)")
-        aliases.append(nm)
-    with_clause = "WITH " + ", ".join(ctes)
-    cross = " CROSS JOIN ".join(aliases)
-    return f"{with_clause} SELECT * FROM {cross};"
-
-
-def _results_from_single_row_map(values: Dict[str, Any]) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    for rule_id, failed in values.items():
-        if rule_id == "__no_sql_rules__":
-            continue
-        failed_count = int(failed) if failed is not None else 0
-        out.append(
-            {
-                "rule_id": rule_id,
-                "passed": failed_count == 0,
-                "failed_count": failed_count,
-                "message": "Passed" if failed_count == 0 else "Failed",
-                "severity": "ERROR",
-                "actions_executed": [],
-                "execution_source": "sql",
-            }
-        )
-    return out
+    return f"SELECT {', '.join(selects)} FROM _data;"
 
 
 # --------------------------- DuckDB SQL Executor ------------------------------
@@ -350,20 +332,20 @@ class DuckDBSqlExecutor(SqlExecutor):
 
     name = "duckdb"
 
-    SUPPORTED_RULES = {
+    SUPPORTED_RULES = frozenset({
         "not_null", "unique", "min_rows", "max_rows", "freshness",
         "range", "length",
         "regex", "contains", "starts_with", "ends_with",
         "compare", "conditional_not_null", "conditional_range",
         "custom_agg", "allowed_values", "disallowed_values"
-    }
+    })
+    # Local files, S3, HTTP(S), and Azure ADLS Gen2
+    SUPPORTED_SCHEMES = frozenset({"", "file", "s3", "http", "https", "abfs", "abfss", "az"})
 
     def supports(
         self, handle: DatasetHandle, sql_specs: List[Dict[str, Any]]
     ) -> bool:
-        scheme = (handle.scheme or "").lower()
-        # Support local files, S3, HTTP(S), and Azure ADLS Gen2
-        if scheme not in {"", "file", "s3", "http", "https", "abfs", "abfss", "az"}:
+        if (handle.scheme or "").lower() not in self.SUPPORTED_SCHEMES:
             return False
         return any((s.get("kind") in self.SUPPORTED_RULES) for s in (sql_specs or []))
 
@@ -386,6 +368,7 @@ class DuckDBSqlExecutor(SqlExecutor):
                 "aggregate_selects": [...], # Phase 2: aggregate expressions
                 "aggregate_specs": [...],   # Phase 2: specs for aggregates
                 "supported_specs": [...],   # All supported specs
+                "rule_kinds": {...},        # rule_id -> kind, for result parsing
             }
         """
         exists_specs: List[Dict[str, Any]] = []
@@ -603,6 +586,7 @@ class DuckDBSqlExecutor(SqlExecutor):
             "aggregate_selects": aggregate_selects,
             "aggregate_specs": aggregate_specs,
             "supported_specs": supported_specs,
+            "rule_kinds": {s["rule_id"]: s.get("kind") for s in supported_specs},
         }
 
     def execute(
@@ -638,19 +622,15 @@ class DuckDBSqlExecutor(SqlExecutor):
         staged_path: Optional[str] = None
         results: List[Dict[str, Any]] = []
 
-        # Build rule_kinds mapping from specs
-        rule_kinds = {}
-        for spec in exists_specs:
-            rule_kinds[spec["rule_id"]] = spec.get("kind")
-        for spec in compiled_plan.get("aggregate_specs", []):
-            rule_kinds[spec["rule_id"]] = spec.get("kind")
+        rule_kinds = plan_rule_kinds(compiled_plan)
 
         try:
             tmpdir, staged_path, _ = _create_source_view(con, handle, view, csv_mode=csv_mode)
 
             # Get available columns to filter out rules with missing columns
             cur = con.execute(f"SELECT * FROM {esc_ident(view)} LIMIT 0")
-            available_cols_set = {d[0] for d in cur.description} if cur.description else set()
+            available_cols = [d[0] for d in cur.description] if cur.description else []
+            available_cols_set = set(available_cols)
 
             # Filter exists_specs to only include rules with valid columns
             valid_exists_specs = []
@@ -737,27 +717,32 @@ class DuckDBSqlExecutor(SqlExecutor):
                         exists_results = results_from_row(cols, row, is_exists=True, rule_kinds=rule_kinds)
                         results.extend(exists_results)
 
-            # Phase 2: Aggregate query for remaining rules
+            # Phase 2: Aggregate query for remaining rules. The total row
+            # count rides along in the same scan instead of a second COUNT(*).
+            row_count = None
             if aggregate_selects:
-                agg_sql = _assemble_single_row(aggregate_selects)
+                agg_sql = _assemble_single_row([*aggregate_selects, 'COUNT(*) AS "__row_count"'])
                 cur = con.execute(agg_sql)
                 row = cur.fetchone()
                 cols = [d[0] for d in cur.description] if (row and cur.description) else []
 
                 if row and cols:
-                    agg_results = results_from_row(cols, row, is_exists=False, rule_kinds=rule_kinds)
+                    # The synthetic count is always appended last; slicing by
+                    # position keeps a rule ID of "__row_count" from colliding.
+                    row_count = int(row[-1]) if row[-1] is not None else 0
+                    agg_results = results_from_row(
+                        cols[:-1], tuple(row[:-1]), is_exists=False, rule_kinds=rule_kinds
+                    )
                     results.extend(agg_results)
 
-            # Get row count and column names (avoid separate introspect call)
-            row_count = None
-            available_cols = []
-            try:
-                nrow = con.execute(f"SELECT COUNT(*) FROM {esc_ident(view)}").fetchone()
-                row_count = int(nrow[0]) if nrow and nrow[0] is not None else None
-                cur = con.execute(f"SELECT * FROM {esc_ident(view)} LIMIT 0")
-                available_cols = [d[0] for d in cur.description] if cur.description else []
-            except duckdb.Error as e:
-                _logger.debug(f"Could not get row count/columns: {e}")
+            # Row count when no aggregate ran (column names came from the
+            # LIMIT 0 probe above), avoiding a separate introspect call
+            if row_count is None:
+                try:
+                    nrow = con.execute(f"SELECT COUNT(*) FROM {esc_ident(view)}").fetchone()
+                    row_count = int(nrow[0]) if nrow and nrow[0] is not None else None
+                except duckdb.Error as e:
+                    _logger.debug(f"Could not get row count: {e}")
 
             return {
                 "results": results,
@@ -43,14 +43,16 @@ class PostgresSqlExecutor(DatabaseSqlExecutor):
 
     DIALECT = "postgres"
     INCLUDE_ROW_COUNT_IN_AGGREGATE = True
-    SUPPORTED_RULES = {
+    COMBINE_EXISTS_WITH_AGGREGATE = True
+    SUPPORTED_RULES = frozenset({
         "not_null", "unique", "min_rows", "max_rows",
         "allowed_values", "disallowed_values",
         "freshness", "range", "length",
         "regex", "contains", "starts_with", "ends_with",
         "compare", "conditional_not_null", "conditional_range",
         "custom_sql_check", "custom_agg"
-    }
+    })
+    SUPPORTED_SCHEMES = frozenset({"postgres", "postgresql"})
 
     @property
     def name(self) -> str:
@@ -63,7 +65,7 @@ class PostgresSqlExecutor(DatabaseSqlExecutor):
             return handle.external_conn is not None
 
         # URI-based: handle postgres:// URIs
-        return scheme in {"postgres", "postgresql"}
+        return scheme in self.SUPPORTED_SCHEMES
 
     @contextmanager
     def _get_connection_ctx(self, handle: DatasetHandle):
@@ -48,6 +48,12 @@ def pick_executor(
     return None
 
 
+# Set once register_default_executors() has run. The postgres/sqlserver
+# executors fail to import when their driver is missing, and Python does not
+# cache a failed import, so repeat calls must not retry them.
+_DEFAULTS_REGISTERED = False
+
+
 def register_default_executors() -> None:
     """
     Eagerly import built-in executors so their @register_executor
@@ -56,6 +62,10 @@ def register_default_executors() -> None:
     NOTE: This is the legacy function that loads ALL executors.
     For lazy loading, use register_executors_for_path() instead.
     """
+    global _DEFAULTS_REGISTERED
+    if _DEFAULTS_REGISTERED:
+        return
+
     # Local import triggers decorator side-effect
     from . import duckdb_sql  # noqa: F401
 
@@ -76,6 +86,8 @@ def register_default_executors() -> None:
     except ImportError:
         pass  # clickhouse-connect not installed, skip clickhouse executor
 
+    _DEFAULTS_REGISTERED = True
+
 
 def register_executors_for_path(
     execution_path: str,
@@ -49,14 +49,15 @@ class SqlServerSqlExecutor(DatabaseSqlExecutor):
     DIALECT = "sqlserver"
     # Note: regex is NOT supported - PATINDEX uses LIKE wildcards, not regex.
     # But contains/starts_with/ends_with use LIKE, so they work!
-    SUPPORTED_RULES = {
+    SUPPORTED_RULES = frozenset({
         "not_null", "unique", "min_rows", "max_rows",
         "allowed_values", "disallowed_values",
         "freshness", "range", "length",
         "contains", "starts_with", "ends_with",  # LIKE-based, works on SQL Server
         "compare", "conditional_not_null", "conditional_range",
         "custom_sql_check", "custom_agg"
-    }
+    })
+    SUPPORTED_SCHEMES = frozenset({"mssql", "sqlserver"})
 
     @property
     def name(self) -> str:
@@ -69,7 +70,7 @@ class SqlServerSqlExecutor(DatabaseSqlExecutor):
             return handle.external_conn is not None
 
         # URI-based: handle mssql:// or sqlserver:// URIs
-        return scheme in {"mssql", "sqlserver"}
+        return scheme in self.SUPPORTED_SCHEMES
 
     @contextmanager
     def _get_connection_ctx(self, handle: DatasetHandle):
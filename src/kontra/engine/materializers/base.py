@@ -15,6 +15,7 @@ class BaseMaterializer:
 
     Defines the interface for:
       - Loading a source into a Polars DataFrame (with projection)
+      - Exposing the source as a Polars LazyFrame
       - Peeking the schema
       - Reporting I/O diagnostics
     """
@@ -38,6 +39,22 @@ class BaseMaterializer:
         """Materialize directly as a Polars DataFrame."""
         raise NotImplementedError
 
+    def to_lazy(
+        self,
+        columns: Optional[List[str]],
+        predicate: Optional["pl.Expr"] = None,
+    ) -> "pl.LazyFrame":
+        """
+        Return the dataset as a Polars LazyFrame.
+
+        Default implementation materializes via `to_polars()`; materializers
+        backed by lazy scans override this to defer I/O to the caller.
+        """
+        lf = self.to_polars(columns).lazy()
+        if predicate is not None:
+            lf = lf.filter(predicate)
+        return lf
+
     def io_debug(self) -> Optional[Dict[str, Any]]:
         """Return last I/O diagnostics for observability (or None)."""
         return None  # Default implementation
\ No newline at end of file
@@ -53,6 +53,7 @@ class DuckDBMaterializer(BaseMaterializer):
         self._io_debug_enabled = bool(os.getenv("KONTRA_IO_DEBUG"))
         self._last_io_debug: Optional[Dict[str, Any]] = None
         self._con: Optional["duckdb.DuckDBPyConnection"] = None
+        self._columns: Optional[List[str]] = None
 
     @property
     def con(self) -> "duckdb.DuckDBPyConnection":
@@ -69,7 +70,12 @@ class DuckDBMaterializer(BaseMaterializer):
     def schema(self) -> List[str]:
         """
         Return column names without materializing data (best effort, format-aware).
+
+        Cached per materializer: remote sources pay the footer/header read once.
         """
+        if self._columns is not None:
+            return list(self._columns)
+
         import duckdb
 
         read_fn = self._get_read_function()
@@ -80,7 +86,8 @@ class DuckDBMaterializer(BaseMaterializer):
         except duckdb.Error as e:
             _raise_if_azure_error(self.handle, e)
             raise
-        return [d[0] for d in cur.description] if cur.description else []
+        self._columns = [d[0] for d in cur.description] if cur.description else []
+        return list(self._columns)
 
     def to_polars(self, columns: Optional[List[str]]) -> "pl.DataFrame":
         """
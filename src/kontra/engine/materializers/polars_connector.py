@@ -15,6 +15,8 @@ Design
 - First tries legacy `ConnectorFactory` (for back-compat if present).
 - Otherwise uses native Polars lazy scans:
     - scan_*  → optional .select(projection) → collect()
+- `to_lazy()` exposes the un-collected scan so callers can add their own
+  predicates and let Polars push them into the reader.
 
 Notes
 -----
@@ -31,16 +33,33 @@ from .base import BaseMaterializer
 from .registry import register_materializer
 
 
+# File extension (lowercase, no dot) -> format understood by this materializer.
+_FORMAT_BY_SUFFIX = {"parquet": "parquet", "csv": "csv"}
+
+
 def _infer_format(uri: str, explicit: Optional[str]) -> str:
     """Resolve file format from explicit handle.format or file extension."""
     if explicit:
         return explicit.lower()
-    low = uri.lower()
-    if low.endswith(".parquet"):
-        return "parquet"
-    if low.endswith(".csv"):
-        return "csv"
-    return ""
+    # Only the extension is lowercased, not the whole path.
+    return _FORMAT_BY_SUFFIX.get(uri.rpartition(".")[2].lower(), "")
+
+
+def _parquet_footer_columns(uri: str) -> Optional[List[str]]:
+    """Top-level column names from a local Parquet footer; None defers to Polars."""
+    from kontra.preplan.parquet_meta import read_parquet_meta
+
+    try:
+        meta = read_parquet_meta(uri)
+    except Exception:
+        # Missing file or malformed footer (ParquetMetaError, struct.error,
+        # ValueError, ...): Polars reads it or reports the failure.
+        return None
+    # Nested (or duplicate) top-level fields have no one-to-one schema_types
+    # entry; Polars resolves those.
+    if len(meta.schema_types) != len(meta.schema_names):
+        return None
+    return list(meta.schema_types)
 
 
 @register_materializer("polars-connector")
@@ -52,6 +71,7 @@ class PolarsConnectorMaterializer(BaseMaterializer):
     ----------------
     - Cheap schema peek (names only)
     - DataFrame materialization with optional projection
+    - LazyFrame scan for caller-driven projection/predicate pushdown
     - No side effects; no hidden state
     """
 
@@ -68,12 +88,20 @@ class PolarsConnectorMaterializer(BaseMaterializer):
     def schema(self) -> List[str]:
         """
         Return column names using a lazy scan. Never raises — empty list on failure.
-        """
-        import polars as pl
 
+        Flat local Parquet files are answered from the footer alone, without
+        importing Polars or building a scan plan.
+        """
         uri = self.handle.uri
         fmt = _infer_format(uri, getattr(self.handle, "format", None))
 
+        if fmt == "parquet":
+            cols = _parquet_footer_columns(uri)
+            if cols is not None:
+                return cols
+
+        import polars as pl
+
         try:
             if fmt == "parquet":
                 return list(pl.scan_parquet(uri).collect_schema().names())
@@ -97,8 +125,6 @@ class PolarsConnectorMaterializer(BaseMaterializer):
         1) Attempt legacy connectors path (if installed) to preserve behavior.
         2) Otherwise, native Polars scan with projection via `.select()`.
         """
-        import polars as pl
-
         # --- Legacy path (optional/back-compat) --------------------------------
         try:
             from kontra.connectors.factory import ConnectorFactory  # type: ignore
@@ -111,6 +137,23 @@ class PolarsConnectorMaterializer(BaseMaterializer):
             pass
 
         # --- Native Polars path -------------------------------------------------
+        # NOTE: streaming=True is deprecated; default engine suffices for tests and CI.
+        return self.to_lazy(columns).collect()
+
+    def to_lazy(
+        self,
+        columns: Optional[List[str]],
+        predicate: Optional["pl.Expr"] = None,
+    ) -> "pl.LazyFrame":
+        """
+        Build a lazy scan with projection (and optional filter) applied.
+
+        Nothing is read until the caller collects, so Polars can push the
+        projection and predicate down into the Parquet/CSV reader and skip
+        unneeded columns and row groups at the file level.
+        """
+        import polars as pl
+
         uri = self.handle.uri
         fmt = _infer_format(uri, getattr(self.handle, "format", None))
 
@@ -137,9 +180,10 @@ class PolarsConnectorMaterializer(BaseMaterializer):
 
         if columns:
             lf = lf.select([pl.col(c) for c in columns])
+        if predicate is not None:
+            lf = lf.filter(predicate)
 
-        # NOTE: streaming=True is deprecated; default engine suffices for tests and CI.
-        return lf.collect()
+        return lf
 
     # ------------------------------------------------------------------ #
     # Diagnostics
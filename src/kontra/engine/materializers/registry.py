@@ -134,6 +134,12 @@ def pick_materializer(handle: DatasetHandle) -> Materializer:
     return ctor(handle)
 
 
+# True after the first register_default_materializers() call. A missing
+# psycopg, pymssql or clickhouse-connect is rediscovered on every import
+# attempt, so later engine constructions skip the whole import block.
+_DEFAULTS_REGISTERED = False
+
+
 def register_default_materializers() -> None:
     """
     Eagerly import built-in materializers so their @register_materializer
@@ -142,6 +148,10 @@ def register_default_materializers() -> None:
     NOTE: This is the legacy function that loads ALL materializers.
     For lazy loading, use register_materializers_for_path() instead.
     """
+    global _DEFAULTS_REGISTERED
+    if _DEFAULTS_REGISTERED:
+        return
+
     # Local imports to trigger decorator side-effects
     from . import duckdb  # noqa: F401
     from . import polars_connector  # noqa: F401
@@ -163,6 +173,8 @@ def register_default_materializers() -> None:
     except ImportError:
         pass  # clickhouse-connect not installed, skip clickhouse materializer
 
+    _DEFAULTS_REGISTERED = True
+
 
 def register_materializers_for_path(
     execution_path: str,
@@ -37,24 +37,8 @@ def _ensure_builtin_rules_registered() -> None:
         return
 
     try:
-        import kontra.rule_defs.builtin.allowed_values  # noqa: F401
-        import kontra.rule_defs.builtin.disallowed_values  # noqa: F401
-        import kontra.rule_defs.builtin.custom_sql_check  # noqa: F401
-        import kontra.rule_defs.builtin.dtype  # noqa: F401
-        import kontra.rule_defs.builtin.freshness  # noqa: F401
-        import kontra.rule_defs.builtin.max_rows  # noqa: F401
-        import kontra.rule_defs.builtin.min_rows  # noqa: F401
-        import kontra.rule_defs.builtin.not_null  # noqa: F401
-        import kontra.rule_defs.builtin.range  # noqa: F401
-        import kontra.rule_defs.builtin.length  # noqa: F401
-        import kontra.rule_defs.builtin.regex  # noqa: F401
-        import kontra.rule_defs.builtin.contains  # noqa: F401
-        import kontra.rule_defs.builtin.starts_with  # noqa: F401
-        import kontra.rule_defs.builtin.ends_with  # noqa: F401
-        import kontra.rule_defs.builtin.unique  # noqa: F401
-        import kontra.rule_defs.builtin.compare  # noqa: F401
-        import kontra.rule_defs.builtin.conditional_not_null  # noqa: F401
-        import kontra.rule_defs.builtin.conditional_range  # noqa: F401
+        # The package __init__ imports (and so registers) every builtin rule
+        import kontra.rule_defs.builtin  # noqa: F401
     except ImportError as e:
         raise ImportError(
             "Failed to load builtin rules. This usually means polars is not installed. "
@@ -42,27 +42,27 @@ def merge_results(
     Returns:
         Merged list of rule results
     """
-    # Start with preplan results
-    results: List[Dict[str, Any]] = list(preplan.results_by_id.values())
-
-    # Add SQL results (skip if already in preplan)
-    for r in pushdown.results_by_id.values():
-        if r["rule_id"] not in preplan.results_by_id:
-            results.append(r)
-
-    # Add Polars results (skip if already handled)
-    for r in residual.results:
-        if r["rule_id"] not in preplan.results_by_id and r["rule_id"] not in pushdown.results_by_id:
-            r["severity"] = ctx.severity_map.get(r["rule_id"], "blocking")
-            r["tally"] = ctx.tally_map.get(r["rule_id"], False)
+    results: List[Dict[str, Any]] = []
+    seen: set[str] = set()
+    tiers = (
+        (preplan.results_by_id.values(), False),
+        (pushdown.results_by_id.values(), False),
+        (residual.results, True),
+    )
+    for tier, from_polars in tiers:
+        for r in tier:
+            rid = r["rule_id"]
+            if rid in seen:
+                continue
+            seen.add(rid)
+            if from_polars:
+                r["severity"] = ctx.severity_map.get(rid, "blocking")
+                r["tally"] = ctx.tally_map.get(rid, False)
+            context = ctx.context_map.get(rid)
+            if context:
+                r["context"] = context
             results.append(r)
 
-    # Inject context into all results
-    for r in results:
-        context = ctx.context_map.get(r["rule_id"])
-        if context:
-            r["context"] = context
-
     return results
 
 
@@ -11,6 +11,7 @@ Supports three backends:
 
 from __future__ import annotations
 
+import re
 from typing import Any, Dict, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from kontra.connectors.handle import DatasetHandle
     from kontra.engine.types import CompilationContext
 
+from kontra.connectors.uri_utils import is_parquet as _is_parquet
 from kontra.engine.types import PreplanResult
 from kontra.engine.stats import now_ms
 from kontra.logging import get_logger
@@ -26,6 +28,11 @@ _logger = get_logger(__name__)
 
 _POSTGRES_PREPLAN_ELIGIBLE_OPS = frozenset({"not_null", "dtype", "unique"})
 
+# Preplan failures whose message matches these are real access problems, not
+# "metadata unavailable", and are re-raised instead of silently skipped.
+_AUTH_ERROR_RE = re.compile(r"access denied|forbidden|unauthorized|credentials|authentication", re.I)
+_NOT_FOUND_RE = re.compile(r"not found|no such file|does not exist", re.I)
+
 
 def _build_preplan_summary(
     enabled: bool,
@@ -65,13 +72,15 @@ def _process_preplan_decisions(
         Tuple of (results_by_id, handled_ids, pass_count, fail_count, unknown_count)
     """
     results_by_id: Dict[str, Dict[str, Any]] = {}
-    handled_ids: Set[str] = set()
-    pass_meta = fail_meta = unknown = 0
+    pass_meta = fail_meta = 0
+    # Messages are shared by every rule decided from the same source
+    pass_msg = f"Proven by metadata ({execution_source_msg})"
+    fail_msg = f"Failed: violation proven by {execution_source_msg} metadata"
 
     for rid, decision in pre.rule_decisions.items():
         # If rule needs exact counts (tally=True), skip preplan for this rule
-        if tally_map.get(rid, False):
-            unknown += 1
+        # (so every result built below has tally=False)
+        if decision == "unknown" or tally_map.get(rid, False):
             continue
 
         if decision == "pass_meta":
@@ -79,21 +88,20 @@ def _process_preplan_decisions(
                 "rule_id": rid,
                 "passed": True,
                 "failed_count": 0,
-                "message": f"Proven by metadata ({execution_source_msg})",
+                "message": pass_msg,
                 "execution_source": "metadata",
                 "severity": severity_map.get(rid, "blocking"),
-                "tally": tally_map.get(rid, False),
+                "tally": False,
             }
-            handled_ids.add(rid)
             pass_meta += 1
         elif decision == "fail_meta":
             # Build appropriate message based on rule type
-            details = pre.fail_details.get(rid, {})
-            if details.get("expected") and details.get("actual"):
+            details = pre.fail_details.get(rid)
+            if details and details.get("expected") and details.get("actual"):
                 # dtype mismatch - compact format
                 msg = f"{details['expected']} ≠ {details['actual']}"
             else:
-                msg = f"Failed: violation proven by {execution_source_msg} metadata"
+                msg = fail_msg
             results_by_id[rid] = {
                 "rule_id": rid,
                 "passed": False,
@@ -101,12 +109,12 @@ def _process_preplan_decisions(
                 "message": msg,
                 "execution_source": "metadata",
                 "severity": severity_map.get(rid, "blocking"),
-                "tally": tally_map.get(rid, False),
+                "tally": False,
             }
-            handled_ids.add(rid)
             fail_meta += 1
-        else:
-            unknown += 1
+
+    handled_ids: Set[str] = set(results_by_id)
+    unknown = len(pre.rule_decisions) - len(results_by_id)
 
     return results_by_id, handled_ids, pass_meta, fail_meta, unknown
 
@@ -186,6 +194,7 @@ def _execute_parquet_preplan(
         row_groups=row_groups,
         columns=columns,
         total_rows=total_rows,
+        parquet_metadata=pre.parquet_metadata,
         analyze_ms=analyze_ms,
         summary=_build_preplan_summary(
             enabled=True,
@@ -314,10 +323,6 @@ def _empty_preplan_result(enabled: bool) -> PreplanResult:
     )
 
 
-def _is_parquet(path: str | None) -> bool:
-    return isinstance(path, str) and path.lower().endswith(".parquet")
-
-
 def _execute_clickhouse_preplan(
     handle: "DatasetHandle",
     ctx: "CompilationContext",
@@ -389,22 +394,11 @@ def execute_preplan(
             return _execute_parquet_preplan(handle, ctx, preplan_fs, explain_preplan)
         except Exception as e:
             # Distinguish between "preplan not available" vs "real errors"
-            err_str = str(e).lower()
+            err_str = str(e)
 
             # Re-raise errors that indicate real problems
-            is_auth_error = (
-                "access denied" in err_str
-                or "forbidden" in err_str
-                or "unauthorized" in err_str
-                or "credentials" in err_str
-                or "authentication" in err_str
-            )
-            is_not_found = (
-                isinstance(e, FileNotFoundError)
-                or "not found" in err_str
-                or "no such file" in err_str
-                or "does not exist" in err_str
-            )
+            is_auth_error = _AUTH_ERROR_RE.search(err_str) is not None
+            is_not_found = isinstance(e, FileNotFoundError) or _NOT_FOUND_RE.search(err_str) is not None
             is_permission = isinstance(e, PermissionError)
 
             if is_auth_error or is_not_found or is_permission:
@@ -8,7 +8,7 @@ to avoid loading data into memory.
 
 from __future__ import annotations
 
-from typing import Any, Literal, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Literal, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from kontra.connectors.handle import DatasetHandle
@@ -75,14 +75,13 @@ def execute_pushdown(
 
     staging_tmpdir = None
     try:
-        # Inject effective tally into SQL specs (global override takes precedence)
-        sql_specs_for_compile = []
-        for s in ctx.compiled_full.sql_rules:
-            if s.get("rule_id") not in handled_ids_meta:
-                spec = dict(s)  # Copy to avoid mutating original
-                rid = spec.get("rule_id")
-                spec["tally"] = ctx.tally_map.get(rid, False)
-                sql_specs_for_compile.append(spec)
+        # Inject effective tally into SQL specs (global override takes precedence).
+        # Copies avoid mutating the compiled plan's specs.
+        tally_map = ctx.tally_map
+        sql_specs_for_compile = [
+            {**s, "tally": tally_map.get(s.get("rule_id"), False)}
+            for s in sql_rules_remaining
+        ]
 
         # Compile
         t0 = now_ms()
@@ -97,13 +96,15 @@ def execute_pushdown(
         duck_out = executor.execute(handle, sql_plan_str, csv_mode=csv_mode)
         execute_ms = now_ms() - t0
 
-        # Inject severity and tally into SQL results
-        sql_results_raw = duck_out.get("results", [])
-        for r in sql_results_raw:
-            r["severity"] = ctx.severity_map.get(r.get("rule_id"), "blocking")
-            r["tally"] = ctx.tally_map.get(r.get("rule_id"), False)
-        results_by_id = {r["rule_id"]: r for r in sql_results_raw}
-        handled_ids = set(results_by_id.keys())
+        # Inject severity and tally into SQL results while indexing them
+        severity_map = ctx.severity_map
+        results_by_id: Dict[str, Dict[str, Any]] = {}
+        for r in duck_out.get("results", []):
+            rid = r["rule_id"]
+            r["severity"] = severity_map.get(rid, "blocking")
+            r["tally"] = tally_map.get(rid, False)
+            results_by_id[rid] = r
+        handled_ids = set(results_by_id)
 
         # Get row count and cols from execute result
         t0 = now_ms()
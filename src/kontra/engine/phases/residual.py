@@ -89,7 +89,7 @@ def execute_residual(
 
     # If no residual rules, skip data loading entirely
     if not compiled_residual.predicates and not compiled_residual.fallback_rules:
-        return ResidualResult(results=[], df=None)
+        return ResidualResult(results=[], df=None, required_cols=required_cols_residual)
 
     # Lazy load polars
     pl = _get_polars()
@@ -97,39 +97,53 @@ def execute_residual(
     # Materialize minimal slice
     t0 = now_ms()
 
-    # If preplan produced a row-group manifest, honor it
-    if preplan.effective and _is_parquet(handle.uri) and preplan.row_groups:
-        import pyarrow as pa
+    # If preplan produced a row-group manifest that actually prunes, honor it.
+    # A manifest keeping every row group is just a full read, which the
+    # materializer's native scan does without the Arrow round-trip.
+    manifest_prunes = preplan.summary.get("row_groups_pruned") != 0
+    if preplan.effective and _is_parquet(handle.uri) and preplan.row_groups and manifest_prunes:
         import pyarrow.parquet as pq
 
         cols = (required_cols_residual or None) if enable_projection else None
 
+        is_s3 = _is_s3_uri(handle.uri)
+        is_azure = not is_s3 and _is_azure_uri(handle.uri)
+
         # Reuse preplan filesystem if available, otherwise create from handle
         residual_fs = preplan_fs
-        if residual_fs is None and _is_s3_uri(handle.uri):
+        if residual_fs is None and is_s3:
             try:
                 residual_fs = _create_s3_filesystem(handle)
             except Exception as e:
                 log_exception(_logger, "Could not create S3 filesystem for residual load", e)
-        elif residual_fs is None and _is_azure_uri(handle.uri):
+        elif residual_fs is None and is_azure:
             try:
                 residual_fs = _create_azure_filesystem(handle)
             except Exception as e:
                 log_exception(_logger, "Could not create Azure filesystem for residual load", e)
 
         # PyArrow filesystems expect specific path formats
-        if _is_s3_uri(handle.uri) and residual_fs:
+        if is_s3 and residual_fs:
             residual_path = _s3_uri_to_path(handle.uri)
-        elif _is_azure_uri(handle.uri) and residual_fs:
+        elif is_azure and residual_fs:
             residual_path = _azure_uri_to_path(handle.uri)
         else:
             residual_path = handle.uri
-        pf = pq.ParquetFile(residual_path, filesystem=residual_fs)
+        # pre_buffer coalesces the selected column chunks into a few large
+        # (concurrent) range reads, which matters when latency dominates (S3).
+        # Reusing the preplan's footer saves another round trip on cloud paths.
+        pf = pq.ParquetFile(
+            residual_path,
+            filesystem=residual_fs,
+            pre_buffer=True,
+            metadata=preplan.parquet_metadata,
+        )
 
         pa_cols = cols if cols else None
-        rg_tables = [pf.read_row_group(i, columns=pa_cols) for i in preplan.row_groups]
-        pa_tbl = pa.concat_tables(rg_tables) if len(rg_tables) > 1 else rg_tables[0]
-        df = pl.from_arrow(pa_tbl)
+        pa_tbl = pf.read_row_groups(preplan.row_groups, columns=pa_cols, use_threads=True)
+        # Keep Arrow's per-row-group chunks as Polars chunks instead of copying
+        # everything into contiguous buffers; Polars rechunks lazily if needed.
+        df = pl.from_arrow(pa_tbl, rechunk=False)
     else:
         # Materializer respects projection (engine passes residual required cols)
         df = materializer.to_polars(required_cols_residual or None)
@@ -146,6 +160,7 @@ def execute_residual(
     return ResidualResult(
         results=polars_out.get("results", []),
         df=df,
+        required_cols=required_cols_residual,
         load_ms=load_ms,
         execute_ms=execute_ms,
     )
@@ -21,6 +21,7 @@ for cold start; see the lazy-loading invariant in CLAUDE.md).
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, List, Literal, Optional
 
 Dialect = Literal["duckdb", "postgres", "sqlserver", "clickhouse"]
@@ -40,10 +41,14 @@ SQL_OP_MAP = {
 # Identifier and Literal Escaping (dialect primitives)
 # =============================================================================
 
+@lru_cache(maxsize=4096)
 def esc_ident(name: str, dialect: Dialect = "duckdb") -> str:
     """
     Escape a SQL identifier (column name, table name) for the given dialect.
 
+    Memoized: the same column names and rule ids are quoted for every rule
+    that references them, on every run of a contract.
+
     - DuckDB/PostgreSQL: "name" with " doubled
     - SQL Server: [name] with ] doubled
     - ClickHouse: `name` with ` doubled AND \\ doubled — ClickHouse honors
@@ -24,7 +24,7 @@ one builder here; adding a dialect means adding one ``Renderer`` subclass there.
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from kontra.engine.sql_ir import (
     # Dialect type + primitives re-exported for backwards compatibility
@@ -597,6 +597,23 @@ def _generate_rule_message(
     )
 
 
+def plan_rule_kinds(compiled_plan: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Return the rule_id -> rule_kind map for a compiled SQL plan.
+
+    Executors store it under "rule_kinds" in compile(); plans assembled by
+    hand without that key get it derived from their spec lists.
+    """
+    rule_kinds = compiled_plan.get("rule_kinds")
+    if rule_kinds is not None:
+        return rule_kinds
+    return {
+        spec["rule_id"]: spec.get("kind")
+        for key in ("exists_specs", "aggregate_specs", "custom_sql_specs")
+        for spec in compiled_plan.get(key) or []
+    }
+
+
 def results_from_row(
     columns: List[str],
     values: tuple,
@@ -614,6 +631,7 @@ def results_from_row(
         rule_kinds: Optional dict mapping rule_id -> rule_kind for failure_mode
     """
     rule_kinds = rule_kinds or {}
+    is_tally = not is_exists
     out = []
     for rule_id, val in zip(columns, values):
         if rule_id == "__no_sql_rules__":
@@ -629,9 +647,9 @@ def results_from_row(
             "rule_id": rule_id,
             "passed": failed_count == 0,
             "failed_count": failed_count,
-            "tally": not is_exists,
+            "tally": is_tally,
             "message": _generate_rule_message(
-                rule_kind, failed_count, is_tally=not is_exists, rule_id=rule_id
+                rule_kind, failed_count, is_tally=is_tally, rule_id=rule_id
             ),
             "severity": "ERROR",
             "actions_executed": [],
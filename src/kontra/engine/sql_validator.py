@@ -8,6 +8,7 @@ Ensures user-provided SQL is read-only before executing on production databases.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Set, Tuple
 
 import sqlglot
@@ -118,7 +119,7 @@ FORBIDDEN_FUNCTIONS: Set[str] = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
     """Result of SQL validation."""
 
@@ -128,6 +129,7 @@ class ValidationResult:
     dialect: Optional[str] = None
 
 
+@lru_cache(maxsize=256)
 def validate_sql(
     sql: str,
     dialect: str = "postgres",
@@ -143,6 +145,10 @@ def validate_sql(
     3. It doesn't contain forbidden functions
     4. It doesn't contain multiple statements (no SQL injection via ;)
 
+    Memoized: a contract's custom SQL is re-validated on every compile, and
+    sqlglot parsing dominates compile time. Results are frozen so the shared
+    cached instance cannot be altered by a caller.
+
     Args:
         sql: The SQL statement to validate
         dialect: SQL dialect for parsing ("postgres", "tsql", "duckdb")
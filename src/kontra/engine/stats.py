@@ -11,8 +11,9 @@ Design goals
 - Backwards compatible: existing callers keep working as-is.
 """
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, Dict, Any, List, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Iterable, Iterator, Dict, Any, List, Optional
 import time
 
 if TYPE_CHECKING:
@@ -35,20 +36,21 @@ class RunTimers:
 
     def total_ms(self) -> int:
         """Total time across all phases."""
-        return (
-            self.contract_load_ms
-            + self.data_load_ms
-            + self.compile_ms
-            + self.execute_ms
-            + self.report_ms
-            + self.polars_ms
-            + self.preplan_ms
-            + self.sql_ms
-        )
+        return sum(getattr(self, f.name) for f in fields(self))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block into ``<name>_ms`` (e.g. ``phase("compile")``)."""
+        t0 = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            setattr(self, f"{name}_ms", (time.perf_counter_ns() - t0) // 1_000_000)
 
 
 def now_ms() -> int:
-    return int(time.time() * 1000)
+    """Monotonic milliseconds; only meaningful as a difference between calls."""
+    return time.perf_counter_ns() // 1_000_000
 
 
 # ---------------------------- Summaries ---------------------------------------
@@ -93,10 +95,22 @@ def columns_touched(rule_specs: Iterable[Dict[str, Any]]) -> List[str]:
     """
     Ordered de-duplicated list of columns referenced by rules.
     """
+    return _ordered_columns(r.get("params", {}) for r in rule_specs)
+
+
+def columns_touched_from_rules(rules: Iterable[Any]) -> List[str]:
+    """
+    Like columns_touched(), but reads ``rule.params`` off rule objects
+    (e.g. contract RuleSpecs) without building an intermediate dict per rule.
+    """
+    return _ordered_columns(r.params for r in rules)
+
+
+def _ordered_columns(params_iter: Iterable[Dict[str, Any]]) -> List[str]:
     cols: List[str] = []
     seen: set[str] = set()
-    for r in rule_specs:
-        col = r.get("params", {}).get("column")
+    for params in params_iter:
+        col = params.get("column")
         if isinstance(col, str) and col and col not in seen:
             seen.add(col)
             cols.append(col)
@@ -183,6 +183,8 @@ class PreplanResult:
     row_groups: Optional[List[int]] = None
     columns: Optional[List[str]] = None
     total_rows: Optional[int] = None
+    # pyarrow FileMetaData from the preplan footer read (remote files), if any
+    parquet_metadata: Any = None
     # Timing
     analyze_ms: int = 0
     # Summary for stats
@@ -221,6 +223,8 @@ class ResidualResult:
     """
     results: List[Dict[str, Any]]
     df: Optional[Any] = None  # pl.DataFrame
+    # Columns the residual plan needed (empty if projection off or all-columns)
+    required_cols: List[str] = field(default_factory=list)
     # Timing
     load_ms: int = 0
     execute_ms: int = 0
@@ -74,6 +74,9 @@ class ParquetMeta:
     # Per row group: column name -> {"min": ..., "max": ..., "null_count": int?}
     # min/max are typed Python values (int/float/str/bool/date/datetime/time).
     row_groups: List[Dict[str, Dict[str, Any]]]
+    # pyarrow FileMetaData when the footer was read via pyarrow (None for the
+    # stdlib reader); lets the residual read skip a second footer fetch.
+    arrow_metadata: Any = field(default=None, repr=False, compare=False)
 
     @property
     def num_row_groups(self) -> int:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from datetime import date, datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 if TYPE_CHECKING:
@@ -390,19 +392,32 @@ def _read_meta_pyarrow(path: str, filesystem: "pafs.FileSystem | None" = None) -
         schema_names=schema_names,
         schema_types=_get_schema_types(md.schema),
         row_groups=row_groups,
+        arrow_metadata=md,
     )
 
 
+@lru_cache(maxsize=64)
+def _read_local_meta(path: str, mtime_ns: int, size: int) -> ParquetMeta:
+    """Parse a local footer once per (absolute path, mtime, size) version."""
+    return read_parquet_meta(path)
+
+
 def _read_meta(path: str, filesystem: "pafs.FileSystem | None" = None) -> ParquetMeta:
     """
     Read Parquet footer metadata for preplan.
 
-    Local files use the stdlib-only reader (avoids the ~175ms pyarrow import);
-    cloud filesystems and unparseable footers go through pyarrow.
+    Local files use the stdlib-only reader (avoids the ~175ms pyarrow import)
+    and are memoized on resolved path, mtime and size, so repeated validations
+    of an unchanged file skip the footer parse. The cached ParquetMeta is
+    shared; callers treat it as read-only. Cloud filesystems and unparseable
+    footers go through pyarrow.
     """
     if filesystem is None:
         try:
-            return read_parquet_meta(path)
+            # Resolved so a relative path cannot reuse another cwd's entry
+            real = os.path.realpath(path)
+            st = os.stat(real)
+            return _read_local_meta(real, st.st_mtime_ns, st.st_size)
         except ParquetMetaError as e:
             _logger.debug(f"Pure-Python footer read failed for {path}: {e}; using pyarrow")
     return _read_meta_pyarrow(path, filesystem)
@@ -521,6 +536,7 @@ def preplan_single_parquet(
             "total_rows": md.num_rows,
         },
         fail_details=fail_details,
+        parquet_metadata=md.arrow_metadata,
     )
     return preplan
 
@@ -20,6 +20,46 @@ from .dtype_utils import pg_dtype_matches as _pg_dtype_matches
 # Predicate format: (rule_id, column, op, value)
 Predicate = Tuple[str, str, str, Any]
 
+# Catalog queries issued by fetch_pg_stats_for_preplan, built once at import.
+_PG_CLASS_SQL = """
+    SELECT reltuples::bigint AS row_estimate,
+           relpages AS page_count
+    FROM pg_class
+    WHERE relname = %s
+      AND relnamespace = %s::regnamespace
+"""
+
+_PG_STATS_SQL = """
+    SELECT
+        c.column_name,
+        s.null_frac,
+        s.n_distinct,
+        s.most_common_vals::text,
+        c.data_type,
+        c.udt_name
+    FROM information_schema.columns c
+    LEFT JOIN pg_stats s
+        ON s.schemaname = c.table_schema
+        AND s.tablename = c.table_name
+        AND s.attname = c.column_name
+    WHERE c.table_schema = %s AND c.table_name = %s
+"""
+
+# Per-column keys, in _PG_STATS_SQL select order after column_name.
+_COLUMN_STAT_KEYS = ("null_frac", "n_distinct", "most_common_vals", "data_type", "udt_name")
+
+_PG_UNIQUE_SQL = """
+    SELECT a.attname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = i.indkey[0]
+    WHERE n.nspname = %s
+      AND c.relname = %s
+      AND i.indisunique = true
+      AND array_length(i.indkey, 1) = 1
+"""
+
 
 def fetch_pg_stats_for_preplan(
     handle: DatasetHandle,
@@ -50,16 +90,7 @@ def fetch_pg_stats_for_preplan(
     with get_connection_ctx(handle, "postgres") as conn:
         with conn.cursor() as cur:
             # Table-level stats from pg_class
-            cur.execute(
-                """
-                SELECT reltuples::bigint AS row_estimate,
-                       relpages AS page_count
-                FROM pg_class
-                WHERE relname = %s
-                  AND relnamespace = %s::regnamespace
-                """,
-                (params.table, params.schema),
-            )
+            cur.execute(_PG_CLASS_SQL, (params.table, params.schema))
             row = cur.fetchone()
             table_stats = {
                 "row_estimate": row[0] if row else 0,
@@ -67,52 +98,16 @@ def fetch_pg_stats_for_preplan(
             }
 
             # Column-level stats from pg_stats joined with column types
-            cur.execute(
-                """
-                SELECT
-                    c.column_name,
-                    s.null_frac,
-                    s.n_distinct,
-                    s.most_common_vals::text,
-                    c.data_type,
-                    c.udt_name
-                FROM information_schema.columns c
-                LEFT JOIN pg_stats s
-                    ON s.schemaname = c.table_schema
-                    AND s.tablename = c.table_name
-                    AND s.attname = c.column_name
-                WHERE c.table_schema = %s AND c.table_name = %s
-                """,
-                (params.schema, params.table),
-            )
+            cur.execute(_PG_STATS_SQL, (params.schema, params.table))
 
             result: Dict[str, Dict[str, Any]] = {"__table__": table_stats}
-            for col_row in cur.fetchall():
-                col_name, null_frac, n_distinct, mcv, data_type, udt_name = col_row
-                result[col_name] = {
-                    "null_frac": null_frac,
-                    "n_distinct": n_distinct,
-                    "most_common_vals": mcv,
-                    "data_type": data_type,
-                    "udt_name": udt_name,
-                }
+            result.update(
+                {row[0]: dict(zip(_COLUMN_STAT_KEYS, row[1:])) for row in cur}
+            )
 
             # Only check unique constraints if requested (when there are unique rules)
             if check_unique_constraints:
-                cur.execute(
-                    """
-                    SELECT a.attname
-                    FROM pg_index i
-                    JOIN pg_class c ON c.oid = i.indrelid
-                    JOIN pg_namespace n ON n.oid = c.relnamespace
-                    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = i.indkey[0]
-                    WHERE n.nspname = %s
-                      AND c.relname = %s
-                      AND i.indisunique = true
-                      AND array_length(i.indkey, 1) = 1
-                    """,
-                    (params.schema, params.table),
-                )
+                cur.execute(_PG_UNIQUE_SQL, (params.schema, params.table))
                 result["__unique_columns__"] = {row[0] for row in cur.fetchall()}
 
             return result
@@ -18,9 +18,12 @@ class PrePlan:
     - rule_decisions: rule_id -> Decision ("pass_meta" | "fail_meta" | "unknown").
     - stats: small numbers for observability (e.g., {"rg_total": 19, "rg_kept": 7}).
     - fail_details: rule_id -> details dict for fail_meta rules (e.g., dtype mismatch info).
+    - parquet_metadata: pyarrow FileMetaData if the footer was read via pyarrow, so the
+                        row-group read can reuse it instead of fetching the footer again.
     """
     manifest_columns: List[str]
     manifest_row_groups: List[int]
     rule_decisions: Dict[str, Decision]
     stats: Dict[str, int]
     fail_details: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    parquet_metadata: Any = None
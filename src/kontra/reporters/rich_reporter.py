@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List
+
 from rich.console import Console
 
 _console = Console()
@@ -15,3 +17,9 @@ def report_line(msg: str) -> None:
     """Plain detail line; markup/emoji disabled so literal brackets ([polars])
     and colon-delimited rule IDs (COL:id:not_null) survive untouched."""
     _console.print(msg, markup=False, highlight=False, emoji=False)
+
+
+def report_lines(lines: List[str]) -> None:
+    """Several report_line()s rendered and written in one console call."""
+    if lines:
+        report_line("\n".join(lines))
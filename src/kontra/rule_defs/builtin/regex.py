@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import re
 
@@ -12,6 +13,25 @@ from kontra.state.types import FailureMode
 from kontra.errors import RuleParameterError
 
 
+@lru_cache(maxsize=256)
+def _engine_pattern_error(pattern: str) -> Optional[str]:
+    """
+    Probe `pattern` against the Polars (Rust) regex engine once per process.
+
+    Returns the engine's error text, or None if the pattern compiles. Rules
+    are rebuilt on every run, so without the cache each construction paid
+    for a Series allocation and a regex compile. polars is imported locally
+    to respect the lazy-loading invariant.
+    """
+    import polars as pl
+
+    try:
+        pl.Series([""]).str.contains(pattern)
+    except pl.exceptions.ComputeError as e:
+        return str(e)
+    return None
+
+
 @register_rule("regex", _builtin=True)
 class RegexRule(BaseRule):
     """
@@ -64,17 +84,14 @@ class RegexRule(BaseRule):
         # are rejected by the Rust regex engine. Catching this at construction
         # avoids a tier divergence at runtime where validate() returns
         # failed_count=height while compile_predicate() raises unguarded
-        # (pitfall #4: bad patterns should fail at construction). polars is
-        # imported locally to respect the lazy-loading invariant.
-        import polars as pl
-        try:
-            pl.Series([""]).str.contains(pattern)
-        except pl.exceptions.ComputeError as e:
+        # (pitfall #4: bad patterns should fail at construction).
+        engine_error = _engine_pattern_error(pattern)
+        if engine_error is not None:
             raise RuleParameterError(
                 "regex",
                 "pattern",
-                f"Pattern is not supported by the execution engine: {e}\n  Pattern: {pattern}"
-            ) from e
+                f"Pattern is not supported by the execution engine: {engine_error}\n  Pattern: {pattern}"
+            )
 
     def validate(self, df: pl.DataFrame) -> Dict[str, Any]:
         import polars as pl
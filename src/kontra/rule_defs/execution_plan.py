@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional, Set
+from typing import TYPE_CHECKING, Iterable, List, Dict, Any, Optional, Set, Tuple
 
 if TYPE_CHECKING:
     import polars as pl
@@ -285,28 +285,36 @@ class RuleExecutionPlan:
                 tally_predicates = [p for p in valid_predicates if rule_tally_map.get(p.rule_id, True)]
                 fast_predicates = [p for p in valid_predicates if not rule_tally_map.get(p.rule_id, True)]
 
+                # Evaluate every predicate in one lazy select: a single pass
+                # over df, with common subexpressions (e.g. the same column's
+                # null mask) shared across rules. Rules whose predicate cannot
+                # be evaluated at all come back in fused_errors.
+                fused, fused_errors = _fused_predicate_row(df, tally_predicates, fast_predicates)
+
                 # Execute tally=True predicates with .sum() for exact counts
                 if tally_predicates:
-                    try:
-                        counts_df = df.select([p.expr.sum().alias(p.rule_id) for p in tally_predicates])
-                        counts = counts_df.row(0, named=True)
-                    except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError):
-                        # Batch failed (e.g. type mismatch) — execute each predicate individually
-                        counts = {}
-                        for p in tally_predicates:
+                    counts: Dict[str, Any] = {}
+                    for p in tally_predicates:
+                        err = fused_errors.get(p.rule_id)
+                        if err is None and fused is not None:
+                            counts[p.rule_id] = fused[p.rule_id]
+                            continue
+                        if err is None:
+                            # Fused batch failed on data — evaluate this predicate alone
                             try:
                                 c = df.select(p.expr.sum().alias(p.rule_id)).row(0, named=True)
                                 counts[p.rule_id] = c[p.rule_id]
-                            except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
-                                vec_results.append({
-                                    "rule_id": p.rule_id,
-                                    "passed": False,
-                                    "failed_count": int(df.height),
-                                    "message": f"Rule execution failed: {e}",
-                                    "execution_source": "polars",
-                                    "severity": rule_severity_map.get(p.rule_id, "blocking"),
-                                })
                                 continue
+                            except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
+                                err = e
+                        vec_results.append({
+                            "rule_id": p.rule_id,
+                            "passed": False,
+                            "failed_count": int(df.height),
+                            "message": f"Rule execution failed: {err}",
+                            "execution_source": "polars",
+                            "severity": rule_severity_map.get(p.rule_id, "blocking"),
+                        })
                     for p in tally_predicates:
                         if p.rule_id not in counts:
                             continue  # Already handled in error fallback
@@ -328,26 +336,27 @@ class RuleExecutionPlan:
 
                 # Execute tally=False predicates with .any() for early termination
                 if fast_predicates:
-                    try:
-                        any_df = df.select([p.expr.any().alias(p.rule_id) for p in fast_predicates])
-                        any_results = any_df.row(0, named=True)
-                    except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError):
-                        # Batch failed — execute each predicate individually
-                        any_results = {}
-                        for p in fast_predicates:
+                    any_results: Dict[str, Any] = {}
+                    for p in fast_predicates:
+                        err = fused_errors.get(p.rule_id)
+                        if err is None and fused is not None:
+                            any_results[p.rule_id] = fused[p.rule_id]
+                            continue
+                        if err is None:
                             try:
                                 r = df.select(p.expr.any().alias(p.rule_id)).row(0, named=True)
                                 any_results[p.rule_id] = r[p.rule_id]
-                            except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
-                                vec_results.append({
-                                    "rule_id": p.rule_id,
-                                    "passed": False,
-                                    "failed_count": int(df.height),
-                                    "message": f"Rule execution failed: {e}",
-                                    "execution_source": "polars",
-                                    "severity": rule_severity_map.get(p.rule_id, "blocking"),
-                                })
                                 continue
+                            except (TypeError, pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError) as e:
+                                err = e
+                        vec_results.append({
+                            "rule_id": p.rule_id,
+                            "passed": False,
+                            "failed_count": int(df.height),
+                            "message": f"Rule execution failed: {err}",
+                            "execution_source": "polars",
+                            "severity": rule_severity_map.get(p.rule_id, "blocking"),
+                        })
                     for p in fast_predicates:
                         if p.rule_id not in any_results:
                             continue  # Already handled in error fallback
@@ -415,15 +424,16 @@ class RuleExecutionPlan:
     def summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Aggregate pass/fail counts for reporters."""
         total = len(results)
-        failed = sum(1 for r in results if not r.get("passed", False))
 
-        # Count failures by severity
+        # Count failures (overall and by severity) in a single pass
+        failed = 0
         blocking_failures = 0
         warning_failures = 0
         info_failures = 0
 
         for r in results:
             if not r.get("passed", False):
+                failed += 1
                 severity = r.get("severity", "blocking")
                 if severity == "blocking":
                     blocking_failures += 1
@@ -486,6 +496,58 @@ class RuleExecutionPlan:
 # Helpers
 # --------------------------------------------------------------------------- #
 
+def _fused_predicate_row(
+    df: "pl.DataFrame",
+    tally_predicates: List[Predicate],
+    fast_predicates: List[Predicate],
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Exception]]:
+    """
+    Evaluate tally (.sum) and fast (.any) predicates in a single lazy query.
+
+    Collecting through the lazy engine lets Polars apply common-subexpression
+    elimination across rules, which eager `df.select` skips.
+
+    If the batch fails, each predicate is probed against a zero-row frame:
+    type and schema errors (e.g. comparing a string column to a number) surface
+    there without scanning any data. The batch is then re-run over the
+    predicates that probed cleanly.
+
+    Returns ({rule_id: value}, {rule_id: error}). The row is None when the
+    batch still fails (a data-dependent error, such as a strict cast), so
+    callers evaluate the remaining predicates one by one.
+    """
+    import polars as pl
+
+    exprs = {p.rule_id: p.expr.sum() for p in tally_predicates}
+    exprs.update((p.rule_id, p.expr.any()) for p in fast_predicates)
+
+    def _collect(items: Dict[str, "pl.Expr"]) -> Dict[str, Any]:
+        if not items:
+            return {}
+        select = [e.alias(rule_id) for rule_id, e in items.items()]
+        return df.lazy().select(select).collect().row(0, named=True)
+
+    try:
+        return _collect(exprs), {}
+    except (TypeError, pl.exceptions.PolarsError):
+        pass
+
+    empty = df.clear().lazy()
+    errors: Dict[str, Exception] = {}
+    for rule_id, expr in exprs.items():
+        try:
+            empty.select(expr.alias(rule_id)).collect()
+        except (TypeError, pl.exceptions.PolarsError) as e:
+            errors[rule_id] = e
+    if not errors:
+        return None, {}
+
+    try:
+        return _collect({k: v for k, v in exprs.items() if k not in errors}), errors
+    except (TypeError, pl.exceptions.PolarsError):
+        return None, errors
+
+
 _REQUIRED_RESULT_KEYS = {"rule_id", "passed", "failed_count"}
 
 
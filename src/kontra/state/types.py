@@ -824,6 +824,28 @@ class StateDiff:
     improvements: List[RuleDiff] = field(default_factory=list)  # count decreased
     unchanged: List[RuleDiff] = field(default_factory=list)
 
+    # Severity partitions of new_failures / regressions ("blocking" -> [...]),
+    # filled in the same pass as the flat lists so renderers don't re-scan.
+    new_failures_by_severity: Dict[str, List[RuleDiff]] = field(default_factory=dict)
+    regressions_by_severity: Dict[str, List[RuleDiff]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Directly constructed diffs: derive partitions from the flat lists.
+        if self.new_failures and not self.new_failures_by_severity:
+            for rd in self.new_failures:
+                self.new_failures_by_severity.setdefault(rd.severity, []).append(rd)
+        if self.regressions and not self.regressions_by_severity:
+            for rd in self.regressions:
+                self.regressions_by_severity.setdefault(rd.severity, []).append(rd)
+
+    def _add_new_failure(self, rule_diff: RuleDiff) -> None:
+        self.new_failures.append(rule_diff)
+        self.new_failures_by_severity.setdefault(rule_diff.severity, []).append(rule_diff)
+
+    def _add_regression(self, rule_diff: RuleDiff) -> None:
+        self.regressions.append(rule_diff)
+        self.regressions_by_severity.setdefault(rule_diff.severity, []).append(rule_diff)
+
     @classmethod
     def compute(cls, before: "ValidationState", after: "ValidationState") -> "StateDiff":
         """
@@ -871,7 +893,7 @@ class StateDiff:
                         failure_mode=after_rule.failure_mode,
                         message=after_rule.message,
                     )
-                    diff.new_failures.append(rule_diff)
+                    diff._add_new_failure(rule_diff)
                 continue
 
             # Rule exists in both states
@@ -897,7 +919,7 @@ class StateDiff:
             if was_passing and not now_passing:
                 # Was passing, now failing
                 rule_diff.change_type = "new_failure"
-                diff.new_failures.append(rule_diff)
+                diff._add_new_failure(rule_diff)
             elif not was_passing and now_passing:
                 # Was failing, now passing
                 rule_diff.change_type = "resolved"
@@ -905,7 +927,7 @@ class StateDiff:
             elif delta > 0:
                 # Count increased (regression)
                 rule_diff.change_type = "regression"
-                diff.regressions.append(rule_diff)
+                diff._add_regression(rule_diff)
             elif delta < 0:
                 # Count decreased (improvement)
                 rule_diff.change_type = "improvement"
@@ -999,9 +1021,9 @@ class StateDiff:
         # New failures (most important) - group by severity
         if self.new_failures:
             # Separate by severity
-            blocking = [rd for rd in self.new_failures if rd.severity == "blocking"]
-            warnings = [rd for rd in self.new_failures if rd.severity == "warning"]
-            infos = [rd for rd in self.new_failures if rd.severity == "info"]
+            blocking = self.new_failures_by_severity.get("blocking", [])
+            warnings = self.new_failures_by_severity.get("warning", [])
+            infos = self.new_failures_by_severity.get("info", [])
 
             if blocking:
                 lines.append("")
@@ -1047,9 +1069,9 @@ class StateDiff:
 
         # Regressions (count increased) - group by severity
         if self.regressions:
-            blocking_reg = [rd for rd in self.regressions if rd.severity == "blocking"]
-            warning_reg = [rd for rd in self.regressions if rd.severity == "warning"]
-            info_reg = [rd for rd in self.regressions if rd.severity == "info"]
+            blocking_reg = self.regressions_by_severity.get("blocking", [])
+            warning_reg = self.regressions_by_severity.get("warning", [])
+            info_reg = self.regressions_by_severity.get("info", [])
 
             def fmt_regression(rd):
                 before_str = f"{rd.before_count:,}" if rd.before_count < 1000000 else f"{rd.before_count/1000000:.1f}M"
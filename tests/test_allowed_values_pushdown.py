@@ -8,7 +8,7 @@ from kontra.rule_defs.builtin.allowed_values import AllowedValuesRule
 from kontra.engine.executors.duckdb_sql import DuckDBSqlExecutor
 from kontra.engine.executors.postgres_sql import PostgresSqlExecutor
 from kontra.engine.executors.sqlserver_sql import SqlServerSqlExecutor
-from kontra.engine.sql_utils import agg_allowed_values
+from kontra.engine.sql_utils import agg_allowed_values, plan_rule_kinds
 
 
 def _make_rule(column: str, values: list) -> AllowedValuesRule:
@@ -187,6 +187,26 @@ class TestDuckDBCompileAllowedValues:
         assert len(compiled["aggregate_selects"]) == 1
         # All three are supported
         assert len(compiled["supported_specs"]) == 3
+        assert compiled["rule_kinds"] == {
+            "nn_1": "not_null",
+            "mr_1": "min_rows",
+            "av_1": "allowed_values",
+        }
+        assert plan_rule_kinds(compiled) is compiled["rule_kinds"]
+
+    def test_plan_rule_kinds_for_hand_built_plan(self):
+        """Plans without a rule_kinds key derive it from their spec lists."""
+        plan = {
+            "exists_specs": [{"kind": "not_null", "rule_id": "nn_1"}],
+            "aggregate_specs": [{"kind": "min_rows", "rule_id": "mr_1"}],
+            "custom_sql_specs": [{"kind": "custom_sql_check", "rule_id": "cs_1"}],
+        }
+        assert plan_rule_kinds(plan) == {
+            "nn_1": "not_null",
+            "mr_1": "min_rows",
+            "cs_1": "custom_sql_check",
+        }
+        assert plan_rule_kinds({"exists_specs": []}) == {}
 
     def test_compile_allowed_values_missing_column(self):
         """compile() skips specs with missing column."""
@@ -264,6 +284,34 @@ class TestPostgresCompileAllowedValues:
         assert len(compiled["supported_specs"]) == 1
 
 
+class TestDuckDBAggregateExecution:
+    """The aggregate pass also returns the dataset row count."""
+
+    def test_execute_folds_row_count_into_aggregate(self, tmp_path):
+        from kontra.connectors.handle import DatasetHandle
+
+        path = tmp_path / "events.csv"
+        pl.DataFrame({"status": ["active", "BAD", "pending"]}).write_csv(path)
+        executor = DuckDBSqlExecutor()
+        compiled = executor.compile([
+            {
+                "kind": "allowed_values",
+                "rule_id": "__row_count",
+                "column": "status",
+                "values": ["active", "pending"],
+                "tally": True,
+            }
+        ])
+
+        out = executor.execute(DatasetHandle.from_uri(str(path)), compiled)
+
+        assert out["row_count"] == 3
+        assert out["available_cols"] == ["status"]
+        assert [(r["rule_id"], r["failed_count"]) for r in out["results"]] == [
+            ("__row_count", 1)
+        ]
+
+
 class TestAllowedValuesIntegration:
     """Integration tests for allowed_values with actual data validation."""
 
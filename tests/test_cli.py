@@ -355,6 +355,18 @@ class TestConfig:
         assert result.exit_code == 0
         assert "preplan" in result.output
 
+    def test_config_show_yaml_is_parseable(self, tmp_project):
+        """Config show streams a complete YAML document after the header."""
+        import yaml
+
+        runner.invoke(app, ["init"])
+
+        result = runner.invoke(app, ["config", "show"])
+        assert result.exit_code == 0
+
+        body = result.output.split("\n\n", 1)[1]
+        assert yaml.safe_load(body)["preplan"] == "on"
+
     def test_config_show_json(self, tmp_project):
         """Config show with JSON output."""
         runner.invoke(app, ["init"])
@@ -413,6 +425,28 @@ class TestDiff:
         # Should have some diff output
         assert "Diff" in result.output or "No validation" in result.output or "Only one" in result.output
 
+    def test_diff_rich_output_written_in_full(self, tmp_project, sample_contract):
+        """Rich diff is written in full through the buffered writer."""
+        runner.invoke(app, ["validate", str(sample_contract)])
+        runner.invoke(app, ["validate", str(sample_contract)])
+
+        result = runner.invoke(app, ["diff"])
+        assert result.exit_code == 0
+        assert "Comparing:" in result.output
+        assert result.output.endswith("No changes detected\n")
+
+    def test_diff_missing_contract_is_config_error(self, tmp_project):
+        """A missing contract path exits with the config-error code."""
+        result = runner.invoke(app, ["diff", "nonexistent.yml"])
+        assert result.exit_code == 2
+        assert "Error:" in result.output
+
+    def test_scout_diff_alias_forwards_to_profile_diff(self, tmp_project):
+        """Deprecated scout-diff still reaches profile-diff."""
+        result = runner.invoke(app, ["scout-diff"])
+        assert result.exit_code == 0
+        assert "No saved profiles found" in result.output
+
     def test_diff_json_output(self, tmp_project, sample_contract):
         """Diff with JSON output."""
         # Run validation twice
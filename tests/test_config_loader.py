@@ -299,6 +299,51 @@ rules: []
         assert contract.datasource == "s3://bucket/data.parquet"
 
 
+# =============================================================================
+# Parsed YAML Cache Tests
+# =============================================================================
+
+
+class TestParsedYamlCache:
+    """Parsed contract YAML is reused until the file changes."""
+
+    def test_repeat_loads_reuse_parse_but_return_fresh_contracts(self, tmp_path):
+        import os
+        from kontra.config import loader
+
+        contract_file = tmp_path / "contract.yml"
+        contract_file.write_text("name: cached\nrules:\n  - name: not_null\n    params: {column: id}\n")
+
+        loader._parse_yaml_file.cache_clear()
+        first = ContractLoader.from_path(contract_file)
+        first.rules.append(RuleSpec(name="min_rows", params={"threshold": 1}))
+        second = ContractLoader.from_path(contract_file)
+
+        assert loader._parse_yaml_file.cache_info().hits == 1
+        assert [r.name for r in second.rules] == ["not_null"]
+
+        contract_file.write_text("name: edited\nrules: []\n")
+        st = contract_file.stat()
+        os.utime(contract_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert ContractLoader.from_path(contract_file).name == "edited"
+
+    def test_same_relative_name_in_different_dirs_is_not_shared(self, tmp_path, monkeypatch):
+        import os
+
+        body_a = "name: aaa\nrules: []\n"
+        body_b = "name: bbb\nrules: []\n"
+        for sub, body in (("a", body_a), ("b", body_b)):
+            (tmp_path / sub).mkdir()
+            (tmp_path / sub / "contract.yml").write_text(body)
+            # Same size and preserved mtime, as after `cp -p` or tar extraction
+            os.utime(tmp_path / sub / "contract.yml", ns=(0, 1_000_000_000))
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert ContractLoader.from_path("contract.yml").name == "aaa"
+        monkeypatch.chdir(tmp_path / "b")
+        assert ContractLoader.from_path("contract.yml").name == "bbb"
+
+
 # =============================================================================
 # S3 Storage Options Tests
 # =============================================================================
@@ -11,6 +11,19 @@ def test_duckdb_materializer_selects_json_reader_for_json_files():
         assert materializer._get_read_function() == "read_json_auto"
 
 
+def test_duckdb_materializer_schema_is_cached(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id":1,"kind":"open"}\n')
+    materializer = DuckDBMaterializer(DatasetHandle.from_uri(str(path)))
+
+    assert materializer.schema() == ["id", "kind"]
+    path.unlink()
+    cols = materializer.schema()
+    assert cols == ["id", "kind"]
+    cols.append("mutated")
+    assert materializer.schema() == ["id", "kind"]
+
+
 def test_scout_reads_json_lines(tmp_path):
     path = tmp_path / "events.jsonl"
     path.write_text('{"id":1,"kind":"open"}\n{"id":2,"kind":"close"}\n')
@@ -57,3 +70,83 @@ def test_scout_parquet_metadata_honors_non_tls_s3_endpoint(monkeypatch):
     assert DuckDBBackend(handle)._get_parquet_metadata() is FakeParquetFile.metadata
     assert filesystem_options["scheme"] == "http"
     assert filesystem_options["endpoint_override"] == "127.0.0.1:9000"
+
+
+def test_polars_connector_to_lazy_defers_projection_and_filter(tmp_path):
+    import polars as pl
+
+    from kontra.engine.materializers.polars_connector import (
+        PolarsConnectorMaterializer,
+    )
+
+    path = tmp_path / "events.parquet"
+    pl.DataFrame({"id": [1, 2, 3], "kind": ["a", "b", "c"]}).write_parquet(path)
+    materializer = PolarsConnectorMaterializer(DatasetHandle.from_uri(str(path)))
+
+    lf = materializer.to_lazy(["id"], predicate=pl.col("id") > 1)
+
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect().to_dict(as_series=False) == {"id": [2, 3]}
+    assert materializer.to_polars(["kind"]).columns == ["kind"]
+
+
+def test_polars_connector_infers_format_from_suffix_only():
+    from kontra.engine.materializers.polars_connector import _infer_format
+
+    assert _infer_format("/Data/Users.PARQUET", None) == "parquet"
+    assert _infer_format("exports/users.Csv", None) == "csv"
+    assert _infer_format("s3://bucket.parquet/users", None) == ""
+    assert _infer_format("users.parquet", "CSV") == "csv"
+
+
+def test_polars_connector_schema_reads_flat_parquet_footer(tmp_path):
+    import polars as pl
+
+    from kontra.engine.materializers.polars_connector import (
+        PolarsConnectorMaterializer,
+        _parquet_footer_columns,
+    )
+
+    flat = tmp_path / "flat.parquet"
+    pl.DataFrame({"id": [1], "kind": ["a"], "ts": [None]}).write_parquet(flat)
+    nested = tmp_path / "nested.parquet"
+    pl.DataFrame({"id": [1], "meta": [{"a": 1, "b": "x"}]}).write_parquet(nested)
+
+    assert _parquet_footer_columns(str(flat)) == ["id", "kind", "ts"]
+    assert _parquet_footer_columns(str(nested)) is None
+    assert _parquet_footer_columns(str(tmp_path / "missing.parquet")) is None
+
+    for path in (flat, nested):
+        materializer = PolarsConnectorMaterializer(DatasetHandle.from_uri(str(path)))
+        assert materializer.schema() == pl.read_parquet(path).columns
+
+
+def test_polars_connector_schema_falls_back_on_bad_footer(tmp_path, monkeypatch):
+    import struct
+
+    import polars as pl
+
+    from kontra.engine.materializers.polars_connector import (
+        PolarsConnectorMaterializer,
+        _parquet_footer_columns,
+    )
+    from kontra.preplan import parquet_meta
+
+    path = tmp_path / "events.parquet"
+    pl.DataFrame({"id": [1], "kind": ["a"]}).write_parquet(path)
+    data = path.read_bytes()
+    truncated = tmp_path / "truncated.parquet"
+    truncated.write_bytes(data[:-20] + data[-8:])
+
+    # Truncated footer: neither reader succeeds, and schema() does not raise
+    assert _parquet_footer_columns(str(truncated)) is None
+    assert PolarsConnectorMaterializer(DatasetHandle.from_uri(str(truncated))).schema() == []
+
+    # Any footer-reader error defers to Polars
+    def broken_reader(uri):
+        raise struct.error("unpack requires a buffer of 4 bytes")
+
+    monkeypatch.setattr(parquet_meta, "read_parquet_meta", broken_reader)
+    assert _parquet_footer_columns(str(path)) is None
+    materializer = PolarsConnectorMaterializer(DatasetHandle.from_uri(str(path)))
+    assert materializer.schema() == ["id", "kind"]
@@ -840,3 +840,47 @@ class TestCustomRuleBadReturnDict:
             assert "something broke" in r.message
         finally:
             RULE_REGISTRY.pop("_test_f016_raise", None)
+
+
+class TestFusedPredicateFallback:
+    """A predicate that cannot be evaluated must not cost the other rules their fused pass."""
+
+    def _plan(self):
+        from kontra.rule_defs.builtin.allowed_values import AllowedValuesRule
+        from kontra.rule_defs.builtin.not_null import NotNullRule
+        from kontra.rule_defs.execution_plan import RuleExecutionPlan
+
+        nn_a = NotNullRule("not_null", {"column": "a"})
+        nn_a.rule_id = "COL:a:not_null"
+        nn_s = NotNullRule("not_null", {"column": "s"})
+        nn_s.rule_id = "COL:s:not_null"
+        # Integer column checked against string values: a type mismatch
+        bad = AllowedValuesRule("allowed_values", {"column": "a", "values": ["x", "y"]})
+        bad.rule_id = "COL:a:allowed_values"
+        return RuleExecutionPlan([nn_a, bad, nn_s])
+
+    def test_type_mismatch_attributed_to_its_rule(self, monkeypatch):
+        """Good rules come from the fused lazy pass; only the bad rule errors."""
+        df = pl.DataFrame({"a": [1, None, 3], "s": [None, None, "z"]})
+        plan = self._plan()
+        compiled = plan.compile()
+
+        # Per-predicate evaluation goes through eager DataFrame.select;
+        # the fused pass does not.
+        eager_calls = []
+        real_select = pl.DataFrame.select
+
+        def spy_select(self, *args, **kwargs):
+            eager_calls.append(args)
+            return real_select(self, *args, **kwargs)
+
+        monkeypatch.setattr(pl.DataFrame, "select", spy_select)
+        results = {r["rule_id"]: r for r in plan.execute_compiled(df, compiled)}
+
+        assert eager_calls == []
+        assert results["COL:a:not_null"]["failed_count"] == 1
+        assert results["COL:s:not_null"]["failed_count"] == 2
+        bad = results["COL:a:allowed_values"]
+        assert bad["passed"] is False
+        assert bad["message"].startswith("Rule execution failed")
+        assert bad["failed_count"] == 3
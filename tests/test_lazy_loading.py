@@ -200,6 +200,84 @@ print('OK: no database drivers for file path')
         )
         assert result.returncode == 0, f"Database drivers loaded for file path:\n{result.stdout}\n{result.stderr}"
 
+    def test_default_registration_does_not_retry_optional_backends(self):
+        """
+        INVARIANT: A second register_default_*() call must not re-import anything.
+
+        With the database drivers missing, the optional backend modules fail to
+        import and are never cached in sys.modules. Without the one-time guard
+        every engine construction would search for them again.
+        """
+        code = """
+import sys
+
+# Make the optional backends fail to import, as a missing driver would
+OPTIONAL = {
+    'kontra.engine.executors.postgres_sql',
+    'kontra.engine.executors.sqlserver_sql',
+    'kontra.engine.materializers.postgres',
+    'kontra.engine.materializers.sqlserver',
+    'kontra.engine.materializers.clickhouse',
+}
+
+class MissingDriver:
+    attempts = []
+    def find_spec(self, name, path=None, target=None):
+        if name in OPTIONAL:
+            self.attempts.append(name)
+            raise ImportError(f'simulated missing driver for {name}')
+        return None
+
+sys.meta_path.insert(0, MissingDriver())
+
+from kontra.engine.executors.registry import register_default_executors
+from kontra.engine.materializers.registry import register_default_materializers
+
+register_default_executors()
+register_default_materializers()
+first = len(MissingDriver.attempts)
+register_default_executors()
+register_default_materializers()
+
+if first == 0:
+    print('FAIL: optional backends were never attempted')
+    sys.exit(1)
+if len(MissingDriver.attempts) != first:
+    print(f'FAIL: re-imported {MissingDriver.attempts[first:]}')
+    sys.exit(1)
+print('OK: default registration ran once')
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"Optional backends re-imported:\n{result.stdout}\n{result.stderr}"
+
+    def test_import_engine_no_rich_or_pyarrow(self):
+        """
+        INVARIANT: Importing the engine module must NOT load rich or pyarrow.
+
+        rich is only needed when the engine prints a report; pyarrow only on
+        the parquet preplan/residual paths. Both are imported where used.
+        """
+        code = """
+import sys
+import kontra.engine.engine
+
+failed = [m for m in ('rich', 'pyarrow') if m in sys.modules]
+if failed:
+    print(f'FAIL: {", ".join(failed)} loaded by kontra.engine.engine')
+    sys.exit(1)
+print('OK: no rich/pyarrow for engine import')
+"""
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, f"Heavy deps loaded by engine import:\n{result.stdout}\n{result.stderr}"
+
     def test_import_time_under_threshold(self):
         """
         INVARIANT: `import kontra` must complete in <200ms.
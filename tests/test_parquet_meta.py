@@ -205,3 +205,52 @@ def test_all_null_column(tmp_path):
     entry = mine.row_groups[0]["x"]
     assert entry["min"] is None and entry["max"] is None
     assert entry["null_count"] == 3
+
+
+def test_planner_footer_cache_tracks_file_version(tmp_path):
+    import os
+
+    from kontra.preplan.planner import _read_meta
+
+    path = _write(tmp_path, pa.table({"x": [1, 2, 3]}))
+    first = _read_meta(path)
+    assert _read_meta(path) is first
+
+    pq.write_table(pa.table({"x": [1, 2, 3, 4, 5]}), path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert _read_meta(path).num_rows == 5
+
+
+def test_planner_footer_cache_resolves_relative_paths(tmp_path, monkeypatch):
+    import os
+
+    from kontra.preplan.planner import _read_meta
+
+    for sub, vals in (("a", [1, 2, 3]), ("b", [7, 8, 9])):
+        (tmp_path / sub).mkdir()
+        path = _write(tmp_path / sub, pa.table({"x": vals}))
+        # Same size and preserved mtime, as after `cp -p` or tar extraction
+        os.utime(path, ns=(0, 1_000_000_000))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert _read_meta("f.parquet").row_groups[0]["x"]["max"] == 3
+    monkeypatch.chdir(tmp_path / "b")
+    assert _read_meta("f.parquet").row_groups[0]["x"]["max"] == 9
+
+
+def test_pyarrow_preplan_carries_footer_for_residual_read(tmp_path):
+    import pyarrow.fs as pafs
+
+    from kontra.preplan.planner import preplan_single_parquet
+
+    path = _write(tmp_path, pa.table({"x": [1, 2, 3, 4]}), row_group_size=2)
+    local = preplan_single_parquet(path=path, required_columns=["x"], predicates=[])
+    assert local.parquet_metadata is None
+
+    pre = preplan_single_parquet(
+        path=path, required_columns=["x"], predicates=[], filesystem=pafs.LocalFileSystem()
+    )
+    assert pre.parquet_metadata is not None
+    pf = pq.ParquetFile(path, metadata=pre.parquet_metadata)
+    assert pf.read_row_groups([1], columns=["x"]).column("x").to_pylist() == [3, 4]
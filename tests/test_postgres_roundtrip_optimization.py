@@ -81,6 +81,40 @@ def test_postgres_fail_fast_does_not_add_row_count_to_exists_query():
     assert result["results"][0]["failed_count"] == 1
 
 
+def test_postgres_combines_exists_checks_into_aggregate_query():
+    cursor = _Cursor(
+        (True, 3, 10),
+        ["email_not_null", "email_unique", "__row_count"],
+    )
+    executor = _executor_with_cursor(cursor)
+    plan = executor.compile(
+        [
+            {
+                "kind": "not_null",
+                "column": "email",
+                "rule_id": "email_not_null",
+                "tally": False,
+            },
+            {
+                "kind": "unique",
+                "column": "email",
+                "rule_id": "email_unique",
+                "tally": True,
+            },
+        ]
+    )
+
+    result = executor.execute(object(), plan)
+
+    assert len(cursor.statements) == 1
+    sql = cursor.statements[0][0]
+    assert sql.index("EXISTS") < sql.index('COUNT(*) AS "__row_count"')
+    assert result["row_count"] == 10
+    by_id = {item["rule_id"]: item for item in result["results"]}
+    assert by_id["email_not_null"]["failed_count"] == 1
+    assert by_id["email_unique"]["failed_count"] == 3
+
+
 def test_pushdown_uses_preplan_estimate_and_plan_columns(monkeypatch):
     from kontra.engine.phases.pushdown import execute_pushdown
     import kontra.engine.executors.registry as registry
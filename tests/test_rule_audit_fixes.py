@@ -52,6 +52,18 @@ class TestRegexEnginePatternValidation:
         with pytest.raises(RuleParameterError):
             kontra.validate(df, rules=[rules.regex("x", r"(a)\1")])
 
+    def test_engine_probe_cached_per_pattern(self):
+        """Rebuilding rules reuses the engine probe, including rejections."""
+        from kontra.rule_defs.builtin.regex import _engine_pattern_error
+
+        _engine_pattern_error.cache_clear()
+        for _ in range(3):
+            RegexRule("regex", {"column": "x", "pattern": r"^\d+$"})
+            with pytest.raises(RuleParameterError):
+                RegexRule("regex", {"column": "x", "pattern": r"(a)\1"})
+        info = _engine_pattern_error.cache_info()
+        assert (info.misses, info.hits) == (2, 4)
+
     def test_lookahead_still_rejected(self):
         """Pre-existing lookahead guard is unaffected."""
         with pytest.raises(RuleParameterError):
@@ -408,6 +408,26 @@ class TestProfileDiff:
         assert "email" in llm_output  # null rate change
 
 
+    def test_rich_render_truncates_long_sections(self):
+        """Rich CLI render shows 10 entries per section plus an overflow line."""
+        from kontra.cli.renderers import render_profile_diff_rich
+
+        id_col = ColumnProfile(name="id", dtype="int", dtype_raw="INTEGER", row_count=100)
+        dropped = [
+            ColumnProfile(name=f"c{i:02d}", dtype="int", dtype_raw="INTEGER", row_count=100)
+            for i in range(12)
+        ]
+        before = self._make_state(100, [id_col] + dropped, "2026-01-12T10:00:00+00:00")
+        after = self._make_state(100, [id_col], "2026-01-13T10:00:00+00:00")
+
+        output = render_profile_diff_rich(ProfileDiff.compute(before, after))
+
+        assert "Columns Removed (12)" in output
+        assert "  - c09" in output
+        assert "  - c10" not in output
+        assert "  ... and 2 more" in output
+
+
 class TestCreateProfileState:
     """Tests for create_profile_state helper."""
 
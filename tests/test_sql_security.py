@@ -148,3 +148,16 @@ class TestExternalAccessBlocking:
         """Verify external access commands are blocked."""
         result = validate_sql(sql, dialect="duckdb")
         assert not result.is_safe, f"Should block {description}"
+
+
+class TestValidationCaching:
+    """validate_sql is memoized; cached results must be immutable."""
+
+    def test_repeat_validation_returns_shared_frozen_result(self):
+        import dataclasses
+
+        sql = "SELECT * FROM _validation_table_ WHERE amount < 0"
+        first = validate_sql(sql, dialect="duckdb")
+        assert validate_sql(sql, dialect="duckdb") is first
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.is_safe = False
@@ -555,6 +555,35 @@ class TestStateDiff:
         assert len(diff.improvements) == 1
         assert diff.improvements[0].delta == -15
 
+    def test_severity_partitions(self):
+        """new_failures/regressions are partitioned by severity during compute."""
+        before = self._make_state(passed=False, rules=[
+            RuleState("COL:a:not_null", "not_null", True, 0, "sql"),
+            RuleState("COL:b:not_null", "not_null", True, 0, "sql", severity="warning"),
+            RuleState("COL:c:not_null", "not_null", False, 1, "sql", severity="info"),
+        ])
+        after = self._make_state(passed=False, rules=[
+            RuleState("COL:a:not_null", "not_null", False, 3, "sql"),
+            RuleState("COL:b:not_null", "not_null", False, 2, "sql", severity="warning"),
+            RuleState("COL:c:not_null", "not_null", False, 5, "sql", severity="info"),
+        ])
+
+        diff = StateDiff.compute(before, after)
+
+        assert [rd.rule_id for rd in diff.new_failures_by_severity["blocking"]] == ["COL:a:not_null"]
+        assert [rd.rule_id for rd in diff.new_failures_by_severity["warning"]] == ["COL:b:not_null"]
+        assert [rd.rule_id for rd in diff.regressions_by_severity["info"]] == ["COL:c:not_null"]
+        assert "blocking" not in diff.regressions_by_severity
+
+        rebuilt = StateDiff(
+            before=before,
+            after=after,
+            new_failures=diff.new_failures,
+            regressions=diff.regressions,
+        )
+        assert rebuilt.new_failures_by_severity == diff.new_failures_by_severity
+        assert rebuilt.regressions_by_severity == diff.regressions_by_severity
+
     def test_to_llm(self):
         """Test LLM-optimized rendering."""
         before = self._make_state(rules=[
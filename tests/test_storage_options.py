@@ -1,6 +1,9 @@
 # tests/test_storage_options.py
 """Tests for storage_options parameter functionality."""
 
+import copy
+import pickle
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -145,6 +148,243 @@ class TestDatasetHandleStorageOptions:
             assert handle.fs_opts.get("s3_region") == "us-east-1"
 
 
+    def test_from_uri_local_handles_are_shared(self):
+        """Env-free local handles are built once per URI."""
+        first = DatasetHandle.from_uri("data/users.parquet")
+
+        assert DatasetHandle.from_uri("data/users.parquet") is first
+        assert first.scheme == "" and first.format == "parquet" and first.fs_opts == {}
+
+    def test_from_uri_s3_handles_track_env(self):
+        """S3 handles are not cached: env changes are picked up per call."""
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "first"}, clear=True):
+            first = DatasetHandle.from_uri("s3://bucket/data.parquet")
+        with patch.dict("os.environ", {"AWS_ACCESS_KEY_ID": "second"}, clear=True):
+            second = DatasetHandle.from_uri("s3://bucket/data.parquet")
+
+        assert first.fs_opts["s3_access_key_id"] == "first"
+        assert second.fs_opts["s3_access_key_id"] == "second"
+
+    def test_from_uri_infers_format_from_suffix(self):
+        """Format comes from the (case-insensitive) extension only."""
+        assert DatasetHandle.from_uri("Data/Users.PARQUET").format == "parquet"
+        assert DatasetHandle.from_uri("exports/users.tsv").format == "csv"
+        assert DatasetHandle.from_uri("logs/events.NDJSON").format == "json"
+        assert DatasetHandle.from_uri("https://host.io/data").format == "unknown"
+        assert DatasetHandle.from_uri("S3://Bucket/Data.csv").scheme == "s3"
+
+    def test_s3_env_snapshot_shared_across_calls(self):
+        """Unchanged S3 env reuses one normalized, read-only snapshot."""
+        from kontra.connectors.handle import _s3_env_snapshot
+
+        with patch.dict("os.environ", {"AWS_REGION": "eu-west-1"}, clear=True):
+            first = _s3_env_snapshot()
+            assert _s3_env_snapshot() is first
+
+        with patch.dict("os.environ", {"AWS_REGION": "eu-west-1"}, clear=True):
+            a = DatasetHandle.from_uri("s3://bucket/a.parquet")
+            b = DatasetHandle.from_uri("s3://bucket/b.parquet")
+        assert a.fs_opts == b.fs_opts == first
+        assert a.fs_opts is not b.fs_opts
+        a.fs_opts["s3_region"] = "us-east-1"  # per-handle dict stays mutable
+        assert b.fs_opts["s3_region"] == "eu-west-1"
+        # Plain dicts keep handles picklable / deep-copyable (multiprocessing)
+        assert pickle.loads(pickle.dumps(b)).fs_opts == b.fs_opts
+        assert copy.deepcopy(b).fs_opts == b.fs_opts
+
+        assert first["s3_region"] == "eu-west-1"
+        assert first["s3_max_connections"] == "64"
+        with pytest.raises(TypeError):
+            first["s3_region"] = "us-east-1"  # type: ignore[index]
+
+    def test_s3_env_credentials_not_memoized(self):
+        """Credential rotation is picked up without growing the normalize cache."""
+        from kontra.connectors import handle as handle_mod
+
+        handle_mod._normalize_s3_env.cache_clear()
+        for secret in ("old-secret", "new-secret"):
+            env = {"AWS_REGION": "eu-west-1", "AWS_ACCESS_KEY_ID": "AKIA", "AWS_SECRET_ACCESS_KEY": secret}
+            with patch.dict("os.environ", env, clear=True):
+                opts = handle_mod._s3_env_snapshot()
+            assert opts["s3_secret_access_key"] == secret
+            assert opts["s3_region"] == "eu-west-1"
+
+        assert handle_mod._normalize_s3_env.cache_info().currsize == 1
+
+    def test_s3_filesystem_reused_for_same_options(self):
+        """Identical S3 options share one PyArrow filesystem instance."""
+        from kontra.connectors import uri_utils
+
+        uri_utils._clear_s3_filesystem_cache()
+        opts = {"s3_endpoint": "http://minio:9000", "s3_access_key_id": "k", "s3_secret_access_key": "s"}
+        a = DatasetHandle.from_uri("s3://bucket/a.parquet", storage_options=opts)
+        b = DatasetHandle.from_uri("s3://bucket/b.parquet", storage_options=opts)
+        rotated = DatasetHandle.from_uri(
+            "s3://bucket/a.parquet", storage_options={**opts, "s3_secret_access_key": "s2"}
+        )
+
+        with patch("pyarrow.fs.S3FileSystem", side_effect=lambda **kw: MagicMock(kw=kw)) as ctor:
+            fs = uri_utils.create_s3_filesystem(a)
+            assert uri_utils.create_s3_filesystem(b) is fs
+            assert uri_utils.create_s3_filesystem(rotated) is not fs
+        assert ctor.call_count == 2
+        assert fs.kw["endpoint_override"] == "minio:9000"
+        assert fs.kw["scheme"] == "http"
+        assert fs.kw["secret_key"] == "s"
+        assert "s" not in {v for key in uri_utils._s3_fs_cache for _, v in key[0]}
+        assert not any("s2" in repr(key) for key in uri_utils._s3_fs_cache)
+        uri_utils._clear_s3_filesystem_cache()
+
+
+class TestDuckDBSession:
+    """Tests for DuckDB connection setup in duckdb_session."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_session_state(self, monkeypatch):
+        from kontra.engine.backends import duckdb_session
+
+        caches = (
+            duckdb_session._thread_count,
+            duckdb_session._compile_s3_settings,
+            duckdb_session._compile_set_sql,
+        )
+        monkeypatch.setattr(duckdb_session, "_THREADS_SQL_FORM", None)
+        monkeypatch.setattr(duckdb_session, "_EXT_INSTALLED", set())
+        for cache in caches:
+            cache.cache_clear()
+        yield
+        for cache in caches:
+            cache.cache_clear()
+
+    def test_thread_count_rereads_env_with_cached_form(self, monkeypatch):
+        """The resolved SQL form is reused, but DUCKDB_THREADS is read per connection."""
+        from kontra.engine.backends import duckdb_session
+        from kontra.engine.backends.duckdb_session import create_duckdb_connection
+
+        handle = DatasetHandle.from_uri("data.parquet")
+        for threads in ("2", "3"):
+            monkeypatch.setenv("DUCKDB_THREADS", threads)
+            con = create_duckdb_connection(handle)
+            try:
+                assert con.execute("SELECT current_setting('threads')").fetchone()[0] == int(threads)
+            finally:
+                con.close()
+            assert duckdb_session._THREADS_SQL_FORM is not None
+
+    def test_invalid_thread_count_after_first_connection_is_ignored(self, monkeypatch):
+        """A bad DUCKDB_THREADS never raises, even once the SQL form is cached."""
+        from kontra.engine.backends import duckdb_session
+        from kontra.engine.backends.duckdb_session import create_duckdb_connection
+
+        handle = DatasetHandle.from_uri("data.parquet")
+        monkeypatch.setenv("DUCKDB_THREADS", "2")
+        create_duckdb_connection(handle).close()
+        assert duckdb_session._THREADS_SQL_FORM is not None
+
+        for bad in ("0", "-1"):
+            monkeypatch.setenv("DUCKDB_THREADS", bad)
+            create_duckdb_connection(handle).close()
+
+    def test_extension_installed_once_per_process(self):
+        """Later connections only LOAD an extension this process installed."""
+        from kontra.engine.backends import duckdb_session
+
+        first, second = MagicMock(), MagicMock()
+        duckdb_session.ensure_extension(first, "azure")
+        duckdb_session.ensure_extension(second, "azure")
+
+        assert [c.args[0] for c in first.execute.call_args_list] == [
+            "INSTALL azure;",
+            "LOAD azure;",
+        ]
+        assert [c.args[0] for c in second.execute.call_args_list] == ["LOAD azure;"]
+
+    def test_extension_reinstalled_after_failed_load(self):
+        """An INSTALL whose LOAD failed is retried on the next connection."""
+        import duckdb
+        from kontra.engine.backends import duckdb_session
+
+        broken, retry = MagicMock(), MagicMock()
+        broken.execute.side_effect = [None, duckdb.Error("broken extension")]
+        with pytest.raises(duckdb.Error):
+            duckdb_session.ensure_extension(broken, "httpfs")
+        duckdb_session.ensure_extension(retry, "httpfs")
+
+        assert [c.args[0] for c in retry.execute.call_args_list] == [
+            "INSTALL httpfs;",
+            "LOAD httpfs;",
+        ]
+        assert duckdb_session._EXT_INSTALLED == {"httpfs"}
+
+    def test_settings_batch_single_execute_with_fallback(self):
+        """SETs are sent in one statement; a failing batch is retried per key."""
+        import duckdb
+        from kontra.engine.backends.duckdb_session import _SettingsBatch
+
+        con = MagicMock()
+        with _SettingsBatch(con) as settings:
+            settings.set("s3_region", "eu-west-1")
+            settings.set("s3_endpoint", "it's")
+        con.execute.assert_called_once_with(
+            "SET s3_region = 'eu-west-1'; SET s3_endpoint = 'it''s'"
+        )
+
+        con = MagicMock()
+        con.execute.side_effect = [duckdb.Error("unknown setting"), None, None]
+        with _SettingsBatch(con) as settings:
+            settings.set("http_keep_alive", "false")
+            settings.set("http_retries", "5")
+        assert con.execute.call_count == 3
+        assert con.execute.call_args_list[2].args == ("SET http_retries = ?", ["5"])
+
+    def test_settings_batch_binds_keys_outside_whitelist(self):
+        """User-supplied or secret keys are never rendered into the cached SQL."""
+        from kontra.engine.backends.duckdb_session import _SettingsBatch, _compile_set_sql
+
+        con = MagicMock()
+        with _SettingsBatch(con) as settings:
+            settings.set("http_retries", "5")
+            settings.set("azure_account_name", "acct'x")
+        assert [c.args for c in con.execute.call_args_list] == [
+            ("SET http_retries = '5'",),
+            ("SET azure_account_name = ?", ["acct'x"]),
+        ]
+
+        with pytest.raises(ValueError, match="s3_secret_access_key"):
+            _compile_set_sql((("s3_secret_access_key", "s3cr3t"),))
+
+    def test_s3_settings_compiled_once_per_fs_opts(self):
+        """Identical fs_opts reuse the derived S3 settings."""
+        from kontra.engine.backends.duckdb_session import _compile_s3_settings
+
+        opts = (("s3_endpoint", "https://minio:9000"), ("s3_region", "eu-west-1"))
+        settings = _compile_s3_settings(opts)
+
+        assert _compile_s3_settings(opts) is settings
+        assert ("s3_endpoint", "minio:9000") in settings
+        assert ("s3_use_ssl", "true") in settings
+        assert ("s3_url_style", "path") in settings
+        assert ("enable_http_metadata_cache", "true") in settings
+
+    def test_s3_credentials_bound_per_connection_not_cached(self):
+        """Secrets are SET as bound parameters and never enter the settings cache."""
+        from kontra.engine.backends import duckdb_session
+
+        con = MagicMock()
+        with patch.object(duckdb_session, "ensure_extension"):
+            duckdb_session._configure_s3(con, {
+                "s3_region": "eu-west-1",
+                "s3_access_key_id": "AKIA_TEST",
+                "s3_secret_access_key": "s3cr3t",
+            })
+
+        calls = [c.args for c in con.execute.call_args_list]
+        assert ("SET s3_secret_access_key = ?", ["s3cr3t"]) in calls
+        assert ("SET s3_access_key_id = ?", ["AKIA_TEST"]) in calls
+        assert all("s3cr3t" not in args[0] for args in calls)
+        assert duckdb_session._compile_s3_settings.cache_info().currsize == 1
+
+
 class TestValidateWithStorageOptions:
     """Tests for kontra.validate() with storage_options parameter."""
 